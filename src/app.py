@@ -8,6 +8,7 @@ Supports environment-based configuration for production, testing, and mock UI mo
 import json
 import logging
 import os
+import re
 import traceback
 from typing import Any
 
@@ -20,6 +21,10 @@ load_dotenv()
 # Module logger (configured by run.py's logging init)
 logger = logging.getLogger(__name__)
 
+# Timestamp pattern (# HH:MM:SS --> HH:MM:SS), compiled once since the
+# transcript display is re-rendered on every progress tick
+_TS_DISPLAY_RE = re.compile(r'# (\d{2}:\d{2}:\d{2} --> \d{2}:\d{2}:\d{2})')
+
 # Handler imports for separation of UI and business logic
 from .config import AppConfig
 from .errors import (
@@ -391,16 +396,9 @@ def format_transcript_for_display(text: str) -> str:
         return ""
 
     # Convert markdown timestamps to HTML with CSS classes
-    import re
-
-    # Pattern for # HH:MM:SS --> HH:MM:SS
-    pattern = r'# (\d{2}:\d{2}:\d{2} --> \d{2}:\d{2}:\d{2})'
-
-    def replace_timestamp(match):
-        timestamp = match.group(1)
-        return f'<span class="timestamp"># {timestamp}</span>'
-
-    formatted = re.sub(pattern, replace_timestamp, text)
+    formatted = _TS_DISPLAY_RE.sub(
+        lambda m: f'<span class="timestamp"># {m.group(1)}</span>', text
+    )
 
     # Convert newlines to HTML breaks for proper display
     formatted = formatted.replace('\n', '<br>')
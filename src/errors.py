@@ -240,11 +240,11 @@ def validate_audio_file_extended(file_path: str, max_size_mb: float = 500) -> di
                 value=file_ext
             )
 
-        # Try to get audio info
+        # Try to get audio info (cached ffprobe metadata, no full decode)
         try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(file_path)
-            duration_seconds = len(audio) / 1000.0
+            from .util import probe_audio_info
+            info = probe_audio_info(file_path)
+            duration_seconds = info["duration_seconds"]
 
             # Check minimum duration
             if duration_seconds < 1:
@@ -266,8 +266,8 @@ def validate_audio_file_extended(file_path: str, max_size_mb: float = 500) -> di
                 "size_mb": file_size_mb,
                 "duration_seconds": duration_seconds,
                 "format": file_ext,
-                "sample_rate": audio.frame_rate,
-                "channels": audio.channels,
+                "sample_rate": info["sample_rate"],
+                "channels": info["channels"],
                 "needs_warning": file_size_mb > 100  # Warning for files > 100MB
             }
 
@@ -7,6 +7,7 @@ in the proper format and structure.
 
 import json
 import os
+import re
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +16,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches translation files (e.g. transcript.ja.txt) while excluding the
+# original transcript and the integrated display file.
+_TRANSLATION_FILE_RE = re.compile(r"^transcript\.(?!txt$|integrated\.txt$).+\.txt$")
+
 
 def save_transcription_files(
     job_dir: str,
@@ -195,24 +200,24 @@ def load_job_files(job_dir: str) -> tuple[str, str, str]:
             import logging
             logging.error(f"Failed to read transcript file: {str(e)}")
 
-    # 翻訳ファイルの読み込み（言語コードを自動検出）
+    # 翻訳ファイルの読み込み（言語コードを自動検出、最初の一致で打ち切り）
     try:
-        for file in os.listdir(job_dir):
-            if (file.startswith("transcript.") and
-                file.endswith(".txt") and
-                file != "transcript.txt" and
-                file != "transcript_integrated.txt"):
-                translation_path = os.path.join(job_dir, file)
-                try:
-                    with open(translation_path, encoding='utf-8') as f:
-                        translation = f.read()
-                    break
-                except Exception as e:
-                    translation, file_error = handle_file_read_failure(
-                        translation_path, e, ""
-                    )
-                    import logging
-                    logging.warning(f"Failed to read translation file {file}: {str(e)}")
+        with os.scandir(job_dir) as entries:
+            translation_entry = next(
+                (entry for entry in entries if _TRANSLATION_FILE_RE.match(entry.name)),
+                None
+            )
+        if translation_entry is not None:
+            translation_path = translation_entry.path
+            try:
+                with open(translation_path, encoding='utf-8') as f:
+                    translation = f.read()
+            except Exception as e:
+                translation, file_error = handle_file_read_failure(
+                    translation_path, e, ""
+                )
+                import logging
+                logging.warning(f"Failed to read translation file {translation_entry.name}: {str(e)}")
     except OSError as e:
         import logging
         logging.warning(f"Failed to list job directory files: {str(e)}")
@@ -317,10 +322,7 @@ def create_download_package(job_dir: str, job_id: str) -> str:
 
     # 翻訳（ある場合）
     for file in os.listdir(job_dir):
-        if (file.startswith("transcript.") and
-            file.endswith(".txt") and
-            file != "transcript.txt" and
-            file != "transcript_integrated.txt"):
+        if _TRANSLATION_FILE_RE.match(file):
             available_files.append((file, os.path.join(job_dir, file)))
 
     # 統合表示（ある場合）
@@ -11,6 +11,7 @@ from typing import Any, NamedTuple
 from ..errors import ValidationError, safe_execute
 from ..file_manager import save_job_metadata, save_transcription_files
 from ..integrated_display import get_display_content_for_ui
+from .history_handler import append_history_index_row
 from ..llm import translate_transcript_full
 from ..transcribe import transcribe_chunked
 from ..util import create_job_directory, estimate_processing_time, validate_audio_file
@@ -224,6 +225,9 @@ class AudioHandler:
 
         safe_execute(_save_metadata, error_context="saving job metadata")
 
+        # Best-effort history index append; the history view rebuilds on mismatch
+        append_history_index_row(job_dir)
+
         # Generate display text for UI with error handling
         display_text = transcript_text  # Default fallback
         try:
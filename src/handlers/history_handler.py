@@ -4,13 +4,150 @@ History handler - manages job history and transcript loading.
 Separates history management business logic from UI event handlers.
 """
 
+import functools
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any
 import logging
 
+from ..errors import handle_file_read_failure
+from ..file_manager import (
+    _TRANSLATION_FILE_RE,
+    get_display_content_from_job,
+    load_job_files,
+    load_job_metadata,
+)
+from ..integrated_display import format_integrated_display
+
 logger = logging.getLogger(__name__)
 
+# Job IDs carrying a date prefix can be resolved without scanning every date folder
+_JOB_DATE_PREFIX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+
+# Sidecar index in the data directory: one JSON row per completed job, so the
+# history view is a sequential read instead of a full tree walk
+_HISTORY_INDEX_FILENAME = "_history_index.jsonl"
+
+
+def _read_small_json(path: str) -> Any:
+    """
+    Read and parse a small JSON file without the buffered text-IO wrapper.
+
+    metadata.json files are tiny, so a raw os.read is cheaper than building
+    a TextIOWrapper per file; json.loads accepts UTF-8 bytes directly.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON document
+
+    Raises:
+        OSError: If the file cannot be opened or read
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, 65536)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return json.loads(b"".join(chunks))
+
+
+def _slim_metadata(metadata: dict[str, Any], job_folder: str) -> dict[str, Any]:
+    """
+    Extract only the metadata fields history rendering consumes.
+
+    Full metadata documents can carry large payloads (segment lists, model
+    info); keeping just these fields lets the parsed document be collected
+    immediately instead of staying alive for the whole history build.
+
+    Args:
+        metadata: Parsed metadata.json document
+        job_folder: Job folder name, used as the job_id fallback
+
+    Returns:
+        Flat dictionary with the fields used by the history views
+    """
+    settings = metadata.get("settings") or {}
+    file_info = metadata.get("file_info") or {}
+    return {
+        "job_id": metadata.get("job_id", job_folder),
+        "timestamp": metadata.get("timestamp", ""),
+        "original_filename": metadata.get("original_filename", ""),
+        "duration_seconds": file_info.get("duration_seconds", 0),
+        "default_language": settings.get("default_language", ""),
+        "default_translation_language": settings.get("default_translation_language", ""),
+        "translation_enabled": metadata.get("translation_enabled", False),
+        "translation_available": metadata.get("translation_available", False),
+    }
+
+
+def append_history_index_row(job_dir: str) -> None:
+    """
+    Append a completed job's history row to the data-directory index.
+
+    Best-effort: failures only log, because get_job_history falls back to a
+    full tree scan and rebuilds the index whenever it is missing or stale.
+
+    Args:
+        job_dir: Job directory whose metadata.json was just written
+    """
+    try:
+        metadata = _read_small_json(os.path.join(job_dir, "metadata.json"))
+        slim = _slim_metadata(metadata, os.path.basename(job_dir))
+        row = [
+            slim["job_id"],
+            slim["timestamp"],
+            slim["original_filename"],
+            f"{slim['duration_seconds']:.1f}s",
+            slim["default_language"],
+            "Completed"
+        ]
+        data_dir = os.path.dirname(os.path.dirname(job_dir))
+        index_path = os.path.join(data_dir, _HISTORY_INDEX_FILENAME)
+        with open(index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    except Exception as e:
+        logger.warning(f"Could not append history index row for {job_dir}: {e}")
+
+
+# Shared reader pool: history walks run from sync Gradio callbacks as well
+# as threads that already host an event loop, where asyncio.run would raise
+_READ_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="history-read")
+
+
+def _read_small_json_or_exc(path: str) -> Any:
+    """Read one JSON file, returning the raised exception on failure."""
+    try:
+        return _read_small_json(path)
+    except Exception as e:
+        return e
+
+
+def _load_metadata_batch(paths: list[str]) -> list[Any]:
+    """
+    Load many small JSON files, overlapping the blocking reads.
+
+    Results align with ``paths``; entries that failed to load are the raised
+    exception instead of a parsed document, so callers can skip them.
+
+    Args:
+        paths: JSON file paths to load
+
+    Returns:
+        List of parsed documents or exceptions, one per path
+    """
+    if len(paths) <= 1:
+        # Not worth a thread hop for a single file
+        return [_read_small_json_or_exc(path) for path in paths]
+    return list(_READ_POOL.map(_read_small_json_or_exc, paths))
+
 
 class HistoryHandler:
     """Real history handler."""
@@ -23,44 +160,131 @@ class HistoryHandler:
     def get_job_history(self) -> list[list[str]]:
         """
         Get list of previous jobs for history view.
-        
+
         Returns:
             List of job records [job_id, timestamp, filename, duration, language, status]
         """
-        jobs = []
+        return list(self.iter_job_history())
+
+    def iter_job_history(self):
+        """
+        Yield job history records lazily, newest date folder first.
 
+        Serves from the sidecar index when it is current; otherwise walks the
+        date folders newest-first, reading each folder's metadata as one
+        concurrent batch, so the first rows are available before the whole
+        tree has been visited. Paginating callers can islice the iterator.
+
+        Yields:
+            Job records [job_id, timestamp, filename, duration, language, status]
+        """
         if not os.path.exists(self.data_dir):
-            return []
+            return
+
+        # Fast path: serve from the sidecar index when it is still current
+        index_jobs = self._load_history_index()
+        if index_jobs is not None:
+            yield from index_jobs
+            return
+
+        jobs = []
+        # A scan that hit I/O errors may have missed jobs; persisting its
+        # result would serve the gaps as fresh until a data-dir mtime bump
+        scan_failed = False
 
         try:
-            for date_folder in sorted(os.listdir(self.data_dir), reverse=True):
-                date_path = os.path.join(self.data_dir, date_folder)
-                if not os.path.isdir(date_path):
+            date_folders = sorted(os.listdir(self.data_dir), reverse=True)
+        except OSError:
+            date_folders = []
+            scan_failed = True
+
+        for date_folder in date_folders:
+            date_path = os.path.join(self.data_dir, date_folder)
+            if not os.path.isdir(date_path):
+                continue
+
+            try:
+                job_folders = os.listdir(date_path)
+            except OSError:
+                scan_failed = True
+                continue
+
+            metadatas = _load_metadata_batch([
+                os.path.join(date_path, job_folder, "metadata.json")
+                for job_folder in job_folders
+            ])
+            for job_folder, metadata in zip(job_folders, metadatas, strict=True):
+                if isinstance(metadata, Exception):
+                    scan_failed = True
+                    continue
+                try:
+                    slim = _slim_metadata(metadata, job_folder)
+                    row = [
+                        slim["job_id"],
+                        slim["timestamp"],
+                        slim["original_filename"],
+                        f"{slim['duration_seconds']:.1f}s",
+                        slim["default_language"],
+                        "Completed"
+                    ]
+                except (AttributeError, KeyError, ValueError):
                     continue
+                jobs.append(row)
+                yield row
 
-                for job_folder in os.listdir(date_path):
-                    job_path = os.path.join(date_path, job_folder)
-                    metadata_path = os.path.join(job_path, "metadata.json")
-
-                    if os.path.exists(metadata_path):
-                        try:
-                            with open(metadata_path, encoding='utf-8') as f:
-                                metadata = json.load(f)
-
-                            jobs.append([
-                                metadata.get("job_id", job_folder),
-                                metadata.get("timestamp", ""),
-                                metadata.get("original_filename", ""),
-                                f"{metadata.get('file_info', {}).get('duration_seconds', 0):.1f}s",
-                                metadata.get("settings", {}).get("default_language", ""),
-                                "Completed"
-                            ])
-                        except (KeyError, ValueError, json.JSONDecodeError):
-                            continue
-        except OSError:
-            pass
+        # Only a fully consumed, error-free walk has seen every job
+        if not scan_failed:
+            self._write_history_index(jobs)
 
-        return jobs
+    def _history_index_path(self) -> str:
+        """Path of the sidecar index file inside the data directory."""
+        return os.path.join(self.data_dir, _HISTORY_INDEX_FILENAME)
+
+    def _load_history_index(self) -> list[list[str]] | None:
+        """
+        Load job rows from the sidecar index if it is still up to date.
+
+        The index is considered stale as soon as the data directory or any
+        date folder has been modified after the last index write (new job
+        folders and deletions both bump those mtimes).
+
+        Returns:
+            Job rows (newest first) or None when the index is missing/stale
+        """
+        index_path = self._history_index_path()
+        try:
+            index_mtime = os.stat(index_path).st_mtime
+            newest_change = os.stat(self.data_dir).st_mtime
+            with os.scandir(self.data_dir) as dir_entries:
+                for entry in dir_entries:
+                    if entry.is_dir():
+                        newest_change = max(newest_change, entry.stat().st_mtime)
+            # Equal timestamps count as stale: filesystem mtime granularity can
+            # put a change on the same tick as the last index write
+            if newest_change >= index_mtime:
+                return None
+
+            with open(index_path, encoding='utf-8') as f:
+                rows = [json.loads(line) for line in f if line.strip()]
+            # Rows are appended oldest first; history shows newest first
+            rows.reverse()
+            return rows
+        except (OSError, ValueError, json.JSONDecodeError):
+            return None
+
+    def _write_history_index(self, jobs: list[list[str]]) -> None:
+        """
+        Rewrite the sidecar index from freshly scanned job rows.
+
+        Args:
+            jobs: Job rows in display order (newest first)
+        """
+        try:
+            with open(self._history_index_path(), 'w', encoding='utf-8') as f:
+                for row in reversed(jobs):
+                    f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write history index: {e}")
 
     def load_job_transcript(self, job_id: str) -> tuple[str, str]:
         """
@@ -72,9 +296,6 @@ class HistoryHandler:
         Returns:
             Tuple of (display_content, translation)
         """
-        from ..errors import handle_file_read_failure
-        from ..file_manager import get_display_content_from_job, load_job_files
-
         if not job_id:
             return "", ""
 
@@ -93,8 +314,7 @@ class HistoryHandler:
             return display_content, translation
 
         except Exception as e:
-            import logging
-            logging.error(f"Error loading job transcript for {job_id}: {e}")
+            logger.error(f"Error loading job transcript for {job_id}: {e}")
             error_content, _ = handle_file_read_failure(
                 f"job_{job_id}", e, "Failed to load job content - files may be corrupted or inaccessible"
             )
@@ -110,13 +330,6 @@ class HistoryHandler:
         Returns:
             Tuple of (display_content, translation, metadata)
         """
-        from ..errors import handle_file_read_failure
-        from ..file_manager import (
-            get_display_content_from_job,
-            load_job_files,
-            load_job_metadata,
-        )
-
         if not job_id:
             return "", "", {}
 
@@ -140,8 +353,7 @@ class HistoryHandler:
             try:
                 metadata = load_job_metadata(job_dir)
             except Exception as e:
-                import logging
-                logging.warning(f"Failed to load metadata for job {job_id}: {e}")
+                logger.warning(f"Failed to load metadata for job {job_id}: {e}")
                 metadata = {"error": "metadata_load_failed"}
 
             # Ensure translation availability is correctly detected
@@ -151,8 +363,7 @@ class HistoryHandler:
             return display_content, translation, metadata
 
         except Exception as e:
-            import logging
-            logging.error(f"Error loading job content for {job_id}: {e}")
+            logger.error(f"Error loading job content for {job_id}: {e}")
             error_content, _ = handle_file_read_failure(
                 f"job_{job_id}", e, "Failed to load job content - files may be corrupted or inaccessible"
             )
@@ -170,6 +381,8 @@ class HistoryHandler:
         if not os.path.exists(self.data_dir):
             return []
 
+        # Collect job entries first, then read all metadata as one concurrent batch
+        entries: list[tuple[str, str, bool]] = []
         try:
             for date_folder in sorted(os.listdir(self.data_dir), reverse=True):
                 date_path = os.path.join(self.data_dir, date_folder)
@@ -178,61 +391,83 @@ class HistoryHandler:
 
                 for job_folder in os.listdir(date_path):
                     job_path = os.path.join(date_path, job_folder)
-                    metadata_path = os.path.join(job_path, "metadata.json")
-
-                    if os.path.exists(metadata_path):
-                        try:
-                            with open(metadata_path, encoding='utf-8') as f:
-                                metadata = json.load(f)
-
-                            # Check for translation availability by examining files if metadata is incomplete
-                            translation_available = metadata.get("translation_available", False)
-                            if not translation_available:
-                                translation_available = self._check_translation_files_exist(job_path)
-
-                            # Determine language display
-                            language = metadata.get("settings", {}).get("default_language", "")
-                            if metadata.get("translation_enabled", False) and translation_available:
-                                target_lang = metadata.get("settings", {}).get("default_translation_language", "")
-                                if target_lang:
-                                    target_lang = target_lang[:2].lower()
-                                else:
-                                    target_lang = "ja"  # Default to Japanese
-                                language = f"{language}+{target_lang}"
-
-                            jobs.append([
-                                metadata.get("job_id", job_folder),
-                                metadata.get("timestamp", ""),
-                                metadata.get("original_filename", ""),
-                                f"{metadata.get('file_info', {}).get('duration_seconds', 0):.1f}s",
-                                language,
-                                "Completed"
-                            ])
-                        except (KeyError, ValueError, json.JSONDecodeError):
-                            continue
+                    metadata_path, has_translation_files = self._scan_job_dir(job_path)
+                    if metadata_path:
+                        entries.append((job_folder, metadata_path, has_translation_files))
         except OSError:
             pass
 
+        metadatas = _load_metadata_batch([path for _, path, _ in entries])
+        for (job_folder, _, has_translation_files), metadata in zip(entries, metadatas, strict=True):
+            if isinstance(metadata, Exception):
+                continue
+            try:
+                slim = _slim_metadata(metadata, job_folder)
+
+                # Check for translation availability by examining files if metadata is incomplete
+                translation_available = slim["translation_available"] or has_translation_files
+
+                # Determine language display
+                language = slim["default_language"]
+                if slim["translation_enabled"] and translation_available:
+                    target_lang = slim["default_translation_language"]
+                    if target_lang:
+                        target_lang = target_lang[:2].lower()
+                    else:
+                        target_lang = "ja"  # Default to Japanese
+                    language = f"{language}+{target_lang}"
+
+                jobs.append([
+                    slim["job_id"],
+                    slim["timestamp"],
+                    slim["original_filename"],
+                    f"{slim['duration_seconds']:.1f}s",
+                    language,
+                    "Completed"
+                ])
+            except (AttributeError, KeyError, ValueError):
+                continue
+
         return jobs
 
+    def _scan_job_dir(self, job_path: str) -> tuple[str | None, bool]:
+        """
+        Scan a job directory once for its metadata file and translation files.
+
+        Args:
+            job_path: Job directory path
+
+        Returns:
+            Tuple of (metadata_path or None, True if translation files exist)
+        """
+        metadata_path = None
+        has_translation = False
+        match = _TRANSLATION_FILE_RE.match
+        try:
+            with os.scandir(job_path) as entries:
+                for entry in entries:
+                    if entry.name == "metadata.json":
+                        metadata_path = entry.path
+                    elif match(entry.name):
+                        has_translation = True
+        except OSError:
+            pass
+        return metadata_path, has_translation
+
     def _check_translation_files_exist(self, job_dir: str) -> bool:
         """
         Check if translation files exist in the job directory.
-        
+
         Args:
             job_dir: Job directory path
-            
+
         Returns:
             True if translation files are found
         """
+        match = _TRANSLATION_FILE_RE.match
         try:
-            for file in os.listdir(job_dir):
-                if (file.startswith("transcript.") and
-                    file.endswith(".txt") and
-                    file != "transcript.txt" and
-                    file != "transcript_integrated.txt"):
-                    return True
-            return False
+            with os.scandir(job_dir) as entries:
+                return any(match(entry.name) for entry in entries)
         except OSError:
             return False
 
@@ -254,13 +489,14 @@ class HistoryHandler:
             if not job_dir:
                 return False
 
-            # Check metadata first
+            # Check metadata first (open directly instead of exists+open)
             metadata_path = os.path.join(job_dir, "metadata.json")
-            if os.path.exists(metadata_path):
-                with open(metadata_path, encoding='utf-8') as f:
-                    metadata = json.load(f)
-                    if metadata.get("translation_available"):
-                        return True
+            try:
+                metadata = _read_small_json(metadata_path)
+                if metadata.get("translation_available"):
+                    return True
+            except (OSError, ValueError, json.JSONDecodeError):
+                pass
 
             # Fallback to file system check
             return self._check_translation_files_exist(job_dir)
@@ -286,14 +522,12 @@ class HistoryHandler:
             if not job_dir:
                 return {}
 
-            # Load metadata
+            # Load metadata (open directly instead of exists+open)
             metadata_path = os.path.join(job_dir, "metadata.json")
-            if os.path.exists(metadata_path):
-                with open(metadata_path, encoding='utf-8') as f:
-                    metadata = json.load(f)
-                return metadata
-
-            return {}
+            try:
+                return _read_small_json(metadata_path)
+            except FileNotFoundError:
+                return {}
 
         except Exception as e:
             logger.error(f"Error loading job details: {e}")
@@ -312,8 +546,20 @@ class HistoryHandler:
         if not os.path.exists(self.data_dir):
             return None
 
-        # Search through date folders
-        for date_folder in os.listdir(self.data_dir):
+        # Fast path: a date-prefixed job ID maps directly to its date folder
+        match = _JOB_DATE_PREFIX_RE.match(job_id)
+        if match:
+            potential_path = os.path.join(self.data_dir, match.group(1), job_id)
+            if os.path.isdir(potential_path):
+                return potential_path
+
+        # Search through date folders, newest first (recent jobs are looked up most)
+        try:
+            date_folders = sorted(os.listdir(self.data_dir), reverse=True)
+        except OSError:
+            return None
+
+        for date_folder in date_folders:
             potential_path = os.path.join(self.data_dir, date_folder, job_id)
             if os.path.exists(potential_path):
                 return potential_path
@@ -371,108 +617,187 @@ class HistoryHandler:
             return False, f"Failed to delete job {job_id}: {str(e)}"
 
 
-class MockHistoryHandler:
-    """Mock history handler for UI testing."""
-
-    def __init__(self):
-        self.mock_jobs = [
-            ["mock-001", "2024-08-10T10:30:00", "sample_audio.mp3", "120.0s", "auto", "Completed"],
-            ["mock-002", "2024-08-10T14:15:00", "meeting_record.wav", "180.5s", "en", "Completed"],
-            ["mock-003", "2024-08-09T16:45:00", "interview.m4a", "95.2s", "ja", "Completed"],
-        ]
-
-    def get_job_history(self) -> list[list[str]]:
-        """
-        Mock job history - returns predefined job list.
-        
-        Returns:
-            List of mock job records
-        """
-        return self.mock_jobs.copy()
-
-    def load_job_transcript(self, job_id: str) -> tuple[str, str]:
-        """
-        Mock transcript loading - returns mock integrated display content.
-        
-        Args:
-            job_id: Job ID to load
-            
-        Returns:
-            Tuple of (mock_display_content, mock_translation)
-        """
-        from ..integrated_display import format_integrated_display
-
-        if not job_id:
-            return "", ""
-
-        # Mock transcript content based on job ID
-        mock_data = {
-            "mock-001": {
-                "transcript": """# 00:00:00 --> 00:01:00
+# Mock fixtures shared by all MockHistoryHandler instances. Wrapped in
+# MappingProxyType so the one copy cannot be mutated between calls.
+_MOCK_DETAILS: MappingProxyType = MappingProxyType({
+    "mock-001": {
+        "job_id": "mock-001",
+        "timestamp": "2024-08-10T10:30:00",
+        "original_filename": "sample_audio.mp3",
+        "file_info": {"duration_seconds": 120.0},
+        "translation_enabled": True,
+        "translation_available": True,
+        "settings": {
+            "default_language": "auto",
+            "default_translation_language": "Japanese"
+        }
+    },
+    "mock-002": {
+        "job_id": "mock-002",
+        "timestamp": "2024-08-10T14:15:00",
+        "original_filename": "meeting_record.wav",
+        "file_info": {"duration_seconds": 180.5},
+        "translation_enabled": False,
+        "translation_available": False,
+        "settings": {
+            "default_language": "en"
+        }
+    },
+    "mock-003": {
+        "job_id": "mock-003",
+        "timestamp": "2024-08-09T16:45:00",
+        "original_filename": "interview.m4a",
+        "file_info": {"duration_seconds": 95.2},
+        "translation_enabled": True,
+        "translation_available": True,
+        "settings": {
+            "default_language": "ja",
+            "default_translation_language": "English"
+        }
+    }
+})
+
+# Template for unknown job IDs; only the job_id field varies per call
+_DEFAULT_JOB_DETAILS: MappingProxyType = MappingProxyType({
+    "job_id": "",
+    "timestamp": "2024-08-10T12:00:00",
+    "original_filename": "unknown.mp3",
+    "file_info": {"duration_seconds": 60.0},
+    "translation_enabled": False,
+    "translation_available": False,
+    "settings": {"default_language": "auto"}
+})
+
+_MOCK_TRANSCRIPTS: MappingProxyType = MappingProxyType({
+    "mock-001": {
+        "transcript": """# 00:00:00 --> 00:01:00
 This is a mock transcript for job mock-001.
 It contains sample content for testing the history loading functionality.
 
 # 00:01:00 --> 00:02:00
 The transcript includes multiple segments with timestamps
 to demonstrate the full transcript viewing experience.""",
-                "translation": """# 00:00:00 --> 00:01:00
+        "translation": """# 00:00:00 --> 00:01:00
 これはジョブ mock-001 のモック転写です。
 履歴読み込み機能をテストするためのサンプルコンテンツが含まれています。
 
 # 00:01:00 --> 00:02:00
 転写には、完全な転写表示体験を実証するために、
 タイムスタンプ付きの複数のセグメントが含まれています。"""
-            },
-            "mock-002": {
-                "transcript": """# 00:00:00 --> 00:01:30
+    },
+    "mock-002": {
+        "transcript": """# 00:00:00 --> 00:01:30
 Mock transcript for meeting recording job mock-002.
 This demonstrates loading different transcripts for different jobs.
 
 # 00:01:30 --> 00:03:00
 Each job has its own unique transcript content
 that can be loaded and displayed independently.""",
-                "translation": ""
-            },
-            "mock-003": {
-                "transcript": """# 00:00:00 --> 00:00:45
+        "translation": ""
+    },
+    "mock-003": {
+        "transcript": """# 00:00:00 --> 00:00:45
 日本語のモック転写 - ジョブ mock-003
 これは日本語音声のテスト用コンテンツです。
 
 # 00:00:45 --> 00:01:35
 各ジョブには独自の転写コンテンツがあり、
 独立して読み込みと表示が可能です。""",
-                "translation": """# 00:00:00 --> 00:00:45
+        "translation": """# 00:00:00 --> 00:00:45
 Mock Japanese transcript - Job mock-003
 This is test content for Japanese audio.
 
 # 00:00:45 --> 00:01:35
 Each job has its own transcript content
 that can be loaded and displayed independently."""
-            }
-        }
+    }
+})
 
-        if job_id in mock_data:
-            data = mock_data[job_id]
-            transcript = data["transcript"]
-            translation = data["translation"]
 
-            # Generate integrated display if translation exists
-            if translation:
-                display_content = format_integrated_display(transcript, translation)
-            else:
-                display_content = transcript
+@functools.lru_cache(maxsize=32)
+def _cached_mock_display(job_id: str) -> tuple[str, str]:
+    """
+    Build the mock display content for a job ID, memoized.
 
-            return display_content, translation
+    Mock transcripts are immutable, so the integrated-display formatting
+    only needs to run once per job ID; repeat polling hits the cache.
+
+    Args:
+        job_id: Job ID to load
+
+    Returns:
+        Tuple of (display_content, translation)
+    """
+    data = _MOCK_TRANSCRIPTS.get(job_id)
+    if data is not None:
+        transcript = data["transcript"]
+        translation = data["translation"]
+
+        # Generate integrated display if translation exists
+        if translation:
+            display_content = format_integrated_display(transcript, translation)
         else:
-            # Default mock content for unknown job IDs with proper timestamp format
-            transcript = f"""# 00:00:00 --> 00:01:00
+            display_content = transcript
+
+        return display_content, translation
+
+    # Default mock content for unknown job IDs with proper timestamp format
+    transcript = f"""# 00:00:00 --> 00:01:00
 Mock transcript for job {job_id}.
 This is default mock content for testing purposes."""
-            translation = f"""# 00:00:00 --> 00:01:00
+    translation = f"""# 00:00:00 --> 00:01:00
 Mock translation for job {job_id}.
 これはテスト用のデフォルトモック翻訳です。"""
-            display_content = format_integrated_display(transcript, translation)
-            return display_content, translation
+    display_content = format_integrated_display(transcript, translation)
+    return display_content, translation
+
+
+class MockHistoryHandler:
+    """Mock history handler for UI testing."""
+
+    def __init__(self):
+        self.mock_jobs = [
+            ["mock-001", "2024-08-10T10:30:00", "sample_audio.mp3", "120.0s", "auto", "Completed"],
+            ["mock-002", "2024-08-10T14:15:00", "meeting_record.wav", "180.5s", "en", "Completed"],
+            ["mock-003", "2024-08-09T16:45:00", "interview.m4a", "95.2s", "ja", "Completed"],
+        ]
+        # Cached history list, invalidated on deletion; callers treat it as read-only
+        self._history_cache: list[list[str]] | None = None
+
+    def get_job_history(self) -> list[list[str]]:
+        """
+        Mock job history - returns predefined job list.
+
+        Returns:
+            List of mock job records (shared, read-only)
+        """
+        if self._history_cache is None:
+            self._history_cache = self.mock_jobs.copy()
+        return self._history_cache
+
+    def iter_job_history(self):
+        """
+        Yield mock job records lazily (interface parity with HistoryHandler).
+
+        Yields:
+            Mock job records
+        """
+        yield from self.get_job_history()
+
+    def load_job_transcript(self, job_id: str) -> tuple[str, str]:
+        """
+        Mock transcript loading - returns mock integrated display content.
+        
+        Args:
+            job_id: Job ID to load
+            
+        Returns:
+            Tuple of (mock_display_content, mock_translation)
+        """
+        if not job_id:
+            return "", ""
+
+        return _cached_mock_display(job_id)
 
     def load_job_content(self, job_id: str) -> tuple[str, str, dict[str, Any]]:
         """
@@ -548,53 +873,10 @@ Mock translation for job {job_id}.
         Returns:
             Mock job details dictionary
         """
-        mock_details = {
-            "mock-001": {
-                "job_id": "mock-001",
-                "timestamp": "2024-08-10T10:30:00",
-                "original_filename": "sample_audio.mp3",
-                "file_info": {"duration_seconds": 120.0},
-                "translation_enabled": True,
-                "translation_available": True,
-                "settings": {
-                    "default_language": "auto",
-                    "default_translation_language": "Japanese"
-                }
-            },
-            "mock-002": {
-                "job_id": "mock-002",
-                "timestamp": "2024-08-10T14:15:00",
-                "original_filename": "meeting_record.wav",
-                "file_info": {"duration_seconds": 180.5},
-                "translation_enabled": False,
-                "translation_available": False,
-                "settings": {
-                    "default_language": "en"
-                }
-            },
-            "mock-003": {
-                "job_id": "mock-003",
-                "timestamp": "2024-08-09T16:45:00",
-                "original_filename": "interview.m4a",
-                "file_info": {"duration_seconds": 95.2},
-                "translation_enabled": True,
-                "translation_available": True,
-                "settings": {
-                    "default_language": "ja",
-                    "default_translation_language": "English"
-                }
-            }
-        }
-
-        return mock_details.get(job_id, {
-            "job_id": job_id,
-            "timestamp": "2024-08-10T12:00:00",
-            "original_filename": "unknown.mp3",
-            "file_info": {"duration_seconds": 60.0},
-            "translation_enabled": False,
-            "translation_available": False,
-            "settings": {"default_language": "auto"}
-        })
+        details = _MOCK_DETAILS.get(job_id)
+        if details is not None:
+            return details
+        return {**_DEFAULT_JOB_DETAILS, "job_id": job_id}
 
     def _check_translation_files_exist(self, job_dir: str) -> bool:
         """
@@ -624,7 +906,8 @@ Mock translation for job {job_id}.
         # Find and remove job from mock list
         original_count = len(self.mock_jobs)
         self.mock_jobs = [job for job in self.mock_jobs if job[0] != job_id]
-        
+        self._history_cache = None
+
         if len(self.mock_jobs) < original_count:
             return True, f"Mock job {job_id} deleted successfully"
         else:
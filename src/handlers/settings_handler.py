@@ -9,45 +9,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared success result for validate_settings; avoids a tuple allocation
+# on every "Save Settings" click.
+_VALIDATION_OK: tuple[bool, str] = (True, "")
+
 from ..errors import ValidationError, get_user_friendly_message, validate_api_key
 from ..util import load_config
 
 
-class SettingsHandler:
-    """Real settings handler."""
-
-    def __init__(self):
-        self.config = load_config()
-
-    def load_default_settings(self) -> dict[str, Any]:
-        """
-        Load default settings from config.yaml.
-        
-        Returns:
-            Default settings dictionary
-        """
-        try:
-            return {
-                "api_key": "",
-                "audio_model": self.config["audio_models"][0] if self.config["audio_models"] else "whisper-1",
-                "language_model": self.config["language_models"][0] if self.config["language_models"] else "gpt-5-mini",
-                "system_message": self.config.get("system_message", ""),
-                "default_language": self.config.get("default_language", "auto"),
-                "default_translation_language": self.config.get("default_translation_language", "Japanese"),
-                "chunk_minutes": self.config.get("default_chunk_minutes", 5),
-                "translation_enabled": False
-            }
-        except Exception:
-            return {
-                "api_key": "",
-                "audio_model": "whisper-1",
-                "language_model": "gpt-5-mini",
-                "system_message": "あなたはプロフェッショナルで親切な文字起こしアシスタントです。",
-                "default_language": "auto",
-                "default_translation_language": "Japanese",
-                "chunk_minutes": 5,
-                "translation_enabled": False
-            }
+class _BaseSettingsHandler:
+    """Shared browser-state and merge logic for real/mock settings handlers."""
 
     def save_settings_to_browser_state(
         self,
@@ -56,11 +27,11 @@ class SettingsHandler:
     ) -> dict[str, Any]:
         """
         Save settings to browser localStorage.
-        
+
         Args:
             settings: Settings to save
             browser_state_value: Current browser state
-            
+
         Returns:
             Updated browser state
         """
@@ -75,10 +46,10 @@ class SettingsHandler:
     ) -> dict[str, Any]:
         """
         Load settings from browser localStorage with fallback to defaults.
-        
+
         Args:
             browser_state_value: Browser state value
-            
+
         Returns:
             Settings dictionary
         """
@@ -88,6 +59,79 @@ class SettingsHandler:
         logger.debug("No settings found in browser state, using defaults.")
         return self.load_default_settings()
 
+    def merge_settings(
+        self,
+        base_settings: dict[str, Any],
+        ui_settings: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Merge UI settings with base settings.
+
+        Args:
+            base_settings: Base settings from browser state
+            ui_settings: Settings from UI components
+
+        Returns:
+            Merged settings dictionary
+        """
+        return {**base_settings, **ui_settings}
+
+
+class SettingsHandler(_BaseSettingsHandler):
+    """Real settings handler."""
+
+    # Used only when the defaults template could not be built from config
+    _FALLBACK_DEFAULTS = {
+        "api_key": "",
+        "audio_model": "whisper-1",
+        "language_model": "gpt-5-mini",
+        "system_message": "あなたはプロフェッショナルで親切な文字起こしアシスタントです。",
+        "default_language": "auto",
+        "default_translation_language": "Japanese",
+        "chunk_minutes": 5,
+        "translation_enabled": False
+    }
+
+    def __init__(self):
+        self.config = load_config()
+        # The config is immutable at runtime, so resolve the default settings
+        # once; load_default_settings then only pays for a dict copy.
+        try:
+            cfg = self.config
+            audio_models = cfg["audio_models"]
+            language_models = cfg["language_models"]
+            self._defaults_template = {
+                "api_key": "",
+                "audio_model": audio_models[0] if audio_models else "whisper-1",
+                "language_model": language_models[0] if language_models else "gpt-5-mini",
+                "system_message": cfg.get("system_message", ""),
+                "default_language": cfg.get("default_language", "auto"),
+                "default_translation_language": cfg.get("default_translation_language", "Japanese"),
+                "chunk_minutes": cfg.get("default_chunk_minutes", 5),
+                "translation_enabled": False
+            }
+        except Exception:
+            self._defaults_template = None
+        # Dropdown choices never change at runtime, so build them once here
+        # instead of reallocating four lists on every UI rerun.
+        self._choices = {
+            "audio_models": self.config.get("audio_models", ["whisper-1"]),
+            "language_models": self.config.get("language_models", ["gpt-5-mini"]),
+            "translation_languages": list(self.config.get("translation_languages", {}).keys()),
+            "languages": ["auto"] + list(self.config.get("translation_languages", {}).keys())
+        }
+
+    def load_default_settings(self) -> dict[str, Any]:
+        """
+        Load default settings from config.yaml.
+        
+        Returns:
+            Default settings dictionary
+        """
+        if self._defaults_template is None:
+            return self._FALLBACK_DEFAULTS.copy()
+        return self._defaults_template.copy()
+
     def validate_settings(self, settings: dict[str, Any]) -> tuple[bool, str]:
         """
         Validate user settings.
@@ -119,30 +163,11 @@ class SettingsHandler:
                     value=chunk_minutes
                 )
 
-            return True, ""
+            return _VALIDATION_OK
 
         except ValidationError as e:
             return False, get_user_friendly_message(e)
 
-    def merge_settings(
-        self,
-        base_settings: dict[str, Any],
-        ui_settings: dict[str, Any]
-    ) -> dict[str, Any]:
-        """
-        Merge UI settings with base settings.
-        
-        Args:
-            base_settings: Base settings from browser state
-            ui_settings: Settings from UI components
-            
-        Returns:
-            Merged settings dictionary
-        """
-        merged = base_settings.copy()
-        merged.update(ui_settings)
-        return merged
-
     def get_config_choices(self) -> dict[str, list]:
         """
         Get configuration choices for UI dropdowns.
@@ -150,15 +175,10 @@ class SettingsHandler:
         Returns:
             Dictionary with model and language choices
         """
-        return {
-            "audio_models": self.config.get("audio_models", ["whisper-1"]),
-            "language_models": self.config.get("language_models", ["gpt-5-mini"]),
-            "translation_languages": list(self.config.get("translation_languages", {}).keys()),
-            "languages": ["auto"] + list(self.config.get("translation_languages", {}).keys())
-        }
+        return self._choices
 
 
-class MockSettingsHandler:
+class MockSettingsHandler(_BaseSettingsHandler):
     """Mock settings handler for UI testing."""
 
     def __init__(self):
@@ -177,6 +197,13 @@ class MockSettingsHandler:
             "default_translation_language": "Japanese",
             "default_chunk_minutes": 5
         }
+        # Precomputed once, mirroring SettingsHandler
+        self._choices = {
+            "audio_models": self.mock_config["audio_models"],
+            "language_models": self.mock_config["language_models"],
+            "translation_languages": list(self.mock_config["translation_languages"].keys()),
+            "languages": ["auto"] + list(self.mock_config["translation_languages"].keys())
+        }
 
     def load_default_settings(self) -> dict[str, Any]:
         """Mock default settings loading."""
@@ -191,45 +218,10 @@ class MockSettingsHandler:
             "translation_enabled": False
         }
 
-    def save_settings_to_browser_state(
-        self,
-        settings: dict[str, Any],
-        browser_state_value: dict[str, Any] | None
-    ) -> dict[str, Any]:
-        """Mock settings saving - always succeeds."""
-        if not isinstance(browser_state_value, dict):
-            browser_state_value = {}
-        browser_state_value["settings"] = settings
-        return browser_state_value
-
-    def load_settings_from_browser_state(
-        self,
-        browser_state_value: dict[str, Any] | None
-    ) -> dict[str, Any]:
-        """Mock settings loading from browser state."""
-        if isinstance(browser_state_value, dict) and "settings" in browser_state_value:
-            return browser_state_value["settings"]
-        return self.load_default_settings()
-
     def validate_settings(self, settings: dict[str, Any]) -> tuple[bool, str]:
         """Mock settings validation - always returns valid."""
-        return True, ""
-
-    def merge_settings(
-        self,
-        base_settings: dict[str, Any],
-        ui_settings: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Mock settings merging."""
-        merged = base_settings.copy()
-        merged.update(ui_settings)
-        return merged
+        return _VALIDATION_OK
 
     def get_config_choices(self) -> dict[str, list]:
         """Mock configuration choices."""
-        return {
-            "audio_models": self.mock_config["audio_models"],
-            "language_models": self.mock_config["language_models"],
-            "translation_languages": list(self.mock_config["translation_languages"].keys()),
-            "languages": ["auto"] + list(self.mock_config["translation_languages"].keys())
-        }
+        return self._choices
@@ -5,7 +5,24 @@ Provides functions to generate integrated display format that combines
 transcription and translation with proper formatting and visual separation.
 """
 
+import functools
+import io
+import logging
 import re
+from itertools import chain, zip_longest
+
+from .errors import IntegratedDisplayError
+
+logger = logging.getLogger(__name__)
+
+# タイムスタンプパターン: # MM:SS --> MM:SS または # HH:MM:SS --> HH:MM:SS
+_TIMESTAMP_RE = re.compile(r'^# (\d{2}:\d{2}(?::\d{2})? --> \d{2}:\d{2}(?::\d{2})?)')
+
+# ラベル付き区切り線（セクションごとに再構築しない）
+_TRANSLATION_SEPARATOR = "─" * 20 + " Translation " + "─" * 20
+
+# 整形結果キャッシュの対象とする入力サイズ上限（巨大テキストのハッシュ計算を避ける）
+_FORMAT_CACHE_MAX_INPUT = 5_000_000
 
 
 def format_integrated_display(transcript: str, translation: str = "") -> str:
@@ -22,121 +39,168 @@ def format_integrated_display(transcript: str, translation: str = "") -> str:
     Raises:
         IntegratedDisplayError: 統合表示生成に失敗した場合
     """
-    from .errors import IntegratedDisplayError
-
     try:
         if not translation:
             # 翻訳なしの場合は転写のみ
             return transcript
 
-        # タイムスタンプベースでセクション分割
-        transcript_sections = parse_timestamp_sections(transcript)
-        translation_sections = parse_timestamp_sections(translation)
+        # 両方にタイムスタンプ行がなければセクションは生成されない
+        if '# ' not in transcript and '# ' not in translation:
+            return ""
 
-        # セクション数を合わせる（翻訳の方が少ない場合に対応）
-        max_sections = max(len(transcript_sections), len(translation_sections))
+        # UI の再描画ごとに同一内容を再整形しないようキャッシュを経由
+        # （巨大な入力はハッシュ計算コストを避けて直接整形）
+        if len(transcript) + len(translation) < _FORMAT_CACHE_MAX_INPUT:
+            return _format_sections_cached(transcript, translation)
 
-        result = []
+        return _format_sections(transcript, translation)
 
-        for i in range(max_sections):
-            # 転写セクションの取得
-            if i < len(transcript_sections):
-                t_section = transcript_sections[i]
-                timestamp = t_section['timestamp']
-                transcript_content = t_section['content']
-            else:
-                timestamp = ""
-                transcript_content = ""
+    except Exception as e:
+        raise IntegratedDisplayError(
+            f"Failed to generate integrated display: {str(e)}",
+            transcript=transcript,
+            translation=translation
+        )
 
-            # 翻訳セクションの取得
-            if i < len(translation_sections):
-                translation_content = translation_sections[i]['content']
-            else:
-                translation_content = ""
 
-            # セクションの構築
-            if timestamp:
-                result.append(timestamp)
-                result.append("")  # 空行
+def _format_single_section(
+    transcript_section: tuple[str, str],
+    translation_section: tuple[str, str]
+) -> str:
+    """
+    単一セクション同士の統合表示を並走ループなしで構築
+    """
+    timestamp, transcript_content = transcript_section
+    _, translation_content = translation_section
 
-            if transcript_content:
-                result.append(transcript_content)
-                result.append("")  # 空行
+    result = []
+    if timestamp:
+        result += [timestamp, ""]
+    if transcript_content:
+        result += [transcript_content, ""]
+    if translation_content:
+        result += [_TRANSLATION_SEPARATOR, "", translation_content, ""]
+    return '\n'.join(result)
 
-            if translation_content:
-                result.append("─" * 20 + " Translation " + "─" * 20)  # ラベル付き区切り線
-                result.append("")  # 空行
-                result.append(translation_content)
-                result.append("")  # 空行
 
-            # セクション間の区切り
-            if i < max_sections - 1:
-                result.append("")  # セクション間の空行
+def _format_sections(transcript: str, translation: str) -> str:
+    """
+    転写・翻訳をセクション単位で並走しながら統合表示を構築
+    """
+    transcript_iter = iter_timestamp_sections(transcript)
+    translation_iter = iter_timestamp_sections(translation)
+
+    # よくある形状（両側とも 0〜1 セクション）はループ機構を経由しない
+    head_t = [section for section in (next(transcript_iter, None), next(transcript_iter, None)) if section]
+    head_tr = [section for section in (next(translation_iter, None), next(translation_iter, None)) if section]
+    if len(head_t) <= 1 and len(head_tr) <= 1:
+        return _format_single_section(
+            head_t[0] if head_t else ("", ""),
+            head_tr[0] if head_tr else ("", "")
+        )
 
-        return '\n'.join(result)
+    result = []
 
-    except Exception as e:
-        raise IntegratedDisplayError(
-            f"Failed to generate integrated display: {str(e)}",
-            transcript=transcript,
-            translation=translation
-        )
+    # 両テキストをセクション単位で並走しながら直接出力を構築
+    # （リスト化せず 1 パスで parse + emit を融合）
+    section_pairs = zip_longest(
+        chain(head_t, transcript_iter),
+        chain(head_tr, translation_iter),
+        fillvalue=("", "")
+    )
+
+    for i, ((timestamp, transcript_content), (_, translation_content)) in enumerate(section_pairs):
+        # セクション間の区切り
+        if i:
+            result.append("")  # セクション間の空行
+
+        # セクションの構築
+        if timestamp:
+            result.append(timestamp)
+            result.append("")  # 空行
+
+        if transcript_content:
+            result.append(transcript_content)
+            result.append("")  # 空行
+
+        if translation_content:
+            result.append(_TRANSLATION_SEPARATOR)
+            result.append("")  # 空行
+            result.append(translation_content)
+            result.append("")  # 空行
+
+    return '\n'.join(result)
+
+
+# Gradio は無関係な操作でも表示を再評価するため、直近の整形結果を LRU で保持
+_format_sections_cached = functools.lru_cache(maxsize=32)(_format_sections)
+
+
+def iter_timestamp_sections(text: str):
+    """
+    タイムスタンプベースでテキストをセクション分割（遅延評価）
+
+    Args:
+        text: 分割対象のテキスト
+
+    Yields:
+        (timestamp, content) のタプル
+    """
+    # タイムスタンプ行が 1 つもないテキストは行ループ不要（O(1) の事前判定）
+    # （タイムスタンプ行は strip 後も必ず "# " を含む）
+    if '# ' not in text:
+        return
+
+    current_timestamp = None
+    current_lines: list[str] = []
+
+    # 全行のリストを一度に確保せず行単位で読み出す（複数 MB の転写で
+    # ピークメモリを抑える）
+    for line in io.StringIO(text):
+        # 空行は strip による新規文字列の生成なしでスキップ
+        if not line or line.isspace():
+            continue
+        line = line.strip()
+
+        if _TIMESTAMP_RE.match(line):
+            # 前のセクションを出力
+            if current_timestamp and current_lines:
+                yield current_timestamp, '\n'.join(current_lines)
+
+            # 新しいセクション開始
+            current_timestamp = line
+            current_lines = []
+        elif current_timestamp:
+            # コンテンツの追加（結合はセクション確定時に一度だけ）
+            current_lines.append(line)
+
+    # 最後のセクションを出力
+    if current_timestamp and current_lines:
+        yield current_timestamp, '\n'.join(current_lines)
 
 
 def parse_timestamp_sections(text: str) -> list[dict[str, str]]:
     """
     タイムスタンプベースでテキストをセクション分割
-    
+
     Args:
         text: 分割対象のテキスト
-        
+
     Returns:
         セクションのリスト（各セクションはtimestampとcontentを含む辞書）
-        
+
     Raises:
         IntegratedDisplayError: セクション分割に失敗した場合
     """
-    from .errors import IntegratedDisplayError
-
     try:
-        sections = []
-        lines = text.split('\n')
-        current_section = None
-
-        # タイムスタンプパターン: # MM:SS --> MM:SS または # HH:MM:SS --> HH:MM:SS
-        timestamp_pattern = r'^# (\d{2}:\d{2}(?::\d{2})? --> \d{2}:\d{2}(?::\d{2})?)'
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if re.match(timestamp_pattern, line):
-                # 前のセクションを保存
-                if current_section and current_section['content']:
-                    sections.append(current_section)
-
-                # 新しいセクション開始
-                current_section = {
-                    'timestamp': line,
-                    'content': ''
-                }
-            elif current_section:
-                # コンテンツの追加
-                if current_section['content']:
-                    current_section['content'] += '\n'
-                current_section['content'] += line
-
-        # 最後のセクションを保存
-        if current_section and current_section['content']:
-            sections.append(current_section)
-
-        return sections
+        return [
+            {'timestamp': timestamp, 'content': content}
+            for timestamp, content in iter_timestamp_sections(text)
+        ]
 
     except Exception as e:
-        safe_text = ""
-        if text is not None:
-            safe_text = text if len(text) < 1000 else text[:1000] + "..."
+        # 例外ペイロードは先頭 1000 文字のみ（巨大テキストの丸ごとコピー回避）
+        safe_text = text[:1000] + "..." if text and len(text) >= 1000 else (text or "")
 
         raise IntegratedDisplayError(
             f"Failed to parse timestamp sections: {str(e)}",
@@ -156,25 +220,32 @@ def validate_integrated_display(transcript: str, translation: str) -> str:
     Returns:
         検証済みの表示テキスト
     """
-    import logging
-
-    logging.debug(f"validate_integrated_display - transcript: {bool(transcript)}, translation: {bool(translation)}")
+    # DEBUG 無効時はフォーマット引数の評価ごとスキップ
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("validate_integrated_display - transcript: %s, translation: %s",
+                     bool(transcript), bool(translation))
 
     if not transcript:
-        logging.debug("validate_integrated_display - no transcript, returning empty")
+        if debug_enabled:
+            logger.debug("validate_integrated_display - no transcript, returning empty")
         return ""
 
     if translation:
-        logging.debug("validate_integrated_display - has translation, calling format_integrated_display")
+        if debug_enabled:
+            logger.debug("validate_integrated_display - has translation, calling format_integrated_display")
         try:
             result = format_integrated_display(transcript, translation)
-            logging.debug(f"validate_integrated_display - format result: {len(result) if result else 0} chars")
+            if debug_enabled:
+                logger.debug("validate_integrated_display - format result: %d chars",
+                             len(result) if result else 0)
             return result
         except Exception as e:
-            logging.error(f"validate_integrated_display - format_integrated_display failed: {str(e)}", exc_info=True)
+            logger.error(f"validate_integrated_display - format_integrated_display failed: {str(e)}", exc_info=True)
             return transcript
     else:
-        logging.debug("validate_integrated_display - no translation, returning transcript")
+        if debug_enabled:
+            logger.debug("validate_integrated_display - no translation, returning transcript")
         return transcript
 
 
@@ -189,17 +260,24 @@ def get_display_content_for_ui(transcript: str, translation: str = "") -> str:
     Returns:
         UI表示用のテキスト
     """
-    import logging
+    # 翻訳なし（転写のみのセッション）はログや検証を経由せず即返す
+    if not translation:
+        return transcript or ""
 
     try:
-        logging.debug(f"get_display_content_for_ui called - transcript: {len(transcript) if transcript else 0} chars, translation: {len(translation) if translation else 0} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_display_content_for_ui called - transcript: %d chars, translation: %d chars",
+                         len(transcript) if transcript else 0,
+                         len(translation) if translation else 0)
 
         result = validate_integrated_display(transcript, translation)
 
-        logging.debug(f"get_display_content_for_ui result - {len(result) if result else 0} chars")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get_display_content_for_ui result - %d chars",
+                         len(result) if result else 0)
 
         return result
     except Exception as e:
         # Fallback to transcript only if integrated display fails
-        logging.error(f"Failed to generate UI display content: {str(e)}", exc_info=True)
+        logger.error(f"Failed to generate UI display content: {str(e)}", exc_info=True)
         return transcript if transcript else "No content available"
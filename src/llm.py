@@ -7,12 +7,21 @@ and CLI interface for testing as specified in INITIAL.md.
 
 import argparse
 import asyncio
+import atexit
+import hashlib
+import io
 import json
 import os
+import random
+import re
+import sqlite3
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
+import httpx
 import openai
 from dotenv import load_dotenv
 from pydantic import BaseModel
@@ -20,8 +29,243 @@ from pydantic import BaseModel
 from .util import load_config
 import logging
 
+# orjson is an optional accelerator for the per-segment JSON hot paths
+# (roughly 3-5x faster encode, 2x decode); fall back to compact stdlib
+# json when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Clients cached per API key so HTTPX connection pools (and their TCP/TLS
+# keep-alive connections) are reused across calls instead of being rebuilt.
+_CLIENT_LOCK = threading.Lock()
+_SYNC_CLIENTS: dict[str, openai.OpenAI] = {}
+_ASYNC_CLIENTS: dict[str, openai.AsyncOpenAI] = {}
+
+
+def _http_limits() -> httpx.Limits:
+    """Connection-pool sizing for the sync client."""
+    return httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _async_http_limits() -> httpx.Limits:
+    """
+    Connection-pool sizing for the async client.
+
+    Sized well above the translation fan-out so the pool never becomes the
+    throughput ceiling when many chunks are dispatched concurrently.
+    """
+    return httpx.Limits(max_connections=512, max_keepalive_connections=100)
+
+
+def _get_sync_client(api_key: str) -> openai.OpenAI:
+    """Return a cached OpenAI client for the given API key."""
+    client = _SYNC_CLIENTS.get(api_key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _SYNC_CLIENTS.get(api_key)
+            if client is None:
+                client = openai.OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(limits=_http_limits()),
+                )
+                _SYNC_CLIENTS[api_key] = client
+    return client
+
+
+def _get_async_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return a cached AsyncOpenAI client for the given API key."""
+    client = _ASYNC_CLIENTS.get(api_key)
+    if client is None:
+        with _CLIENT_LOCK:
+            client = _ASYNC_CLIENTS.get(api_key)
+            if client is None:
+                client = openai.AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=httpx.AsyncClient(limits=_async_http_limits()),
+                )
+                _ASYNC_CLIENTS[api_key] = client
+    return client
+
+
+@atexit.register
+def _close_cached_clients() -> None:
+    """Close pooled HTTP connections cleanly at interpreter shutdown."""
+    for sync_client in _SYNC_CLIENTS.values():
+        try:
+            sync_client.close()
+        except Exception:
+            pass
+    for async_client in _ASYNC_CLIENTS.values():
+        try:
+            asyncio.run(async_client.close())
+        except Exception:
+            pass
+
+
+# Content-addressed disk cache for deterministic structured completions:
+# identical (model, prompts, schema) requests during development are served
+# without an API call. Only used when temperature is effectively zero.
+_LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "transcriber", "llm")
+_LLM_CACHE_MAX_ENTRIES = 1024
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def _llm_cache_connect() -> sqlite3.Connection:
+    os.makedirs(_LLM_CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(_LLM_CACHE_DIR, "structured_completions.db"))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key BLOB PRIMARY KEY, response TEXT NOT NULL, last_used INTEGER NOT NULL)"
+    )
+    return conn
+
+
+def _structured_cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    json_schema: dict[str, Any],
+    temperature: float
+) -> bytes:
+    payload = json.dumps(
+        {"m": model, "s": system_prompt, "u": user_prompt, "j": json_schema, "t": temperature},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def _structured_cache_get(key: bytes) -> dict[str, Any] | None:
+    try:
+        with _LLM_CACHE_LOCK:
+            conn = _llm_cache_connect()
+            try:
+                row = conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?",
+                        (int(time.time()), key),
+                    )
+                return json.loads(row[0])
+            finally:
+                conn.close()
+    except Exception as e:
+        # Cache problems must never fail the request itself
+        logger.warning(f"LLM disk cache read failed: {str(e)}")
+        return None
+
+
+def _structured_cache_put(key: bytes, response: dict[str, Any]) -> None:
+    try:
+        with _LLM_CACHE_LOCK:
+            conn = _llm_cache_connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, response, last_used) VALUES (?, ?, ?)",
+                        (key, json.dumps(response, ensure_ascii=False), int(time.time())),
+                    )
+                    # LRU eviction beyond the entry cap
+                    conn.execute(
+                        "DELETE FROM responses WHERE key NOT IN "
+                        "(SELECT key FROM responses ORDER BY last_used DESC LIMIT ?)",
+                        (_LLM_CACHE_MAX_ENTRIES,),
+                    )
+            finally:
+                conn.close()
+    except Exception as e:
+        logger.warning(f"LLM disk cache write failed: {str(e)}")
+
+
+# Timestamp header line, e.g. "# 00:00:00 --> 00:01:00" (also tolerates
+# leading indentation and "#\t"/"#  " separators); group 1 is the timestamp
+_TS_HEADER_RE = re.compile(r'^\s*#\s+(.+?)\s*$')
+
+# Preamble injected before the transcript in chat_with_context; hoisted so it
+# is not re-allocated on every call
+_CTX_PREFIX = "以下は文字起こしされたテキストです。この内容を参考にして質問に答えてください。\n\n"
+
+# Fallback language codes used when config.yaml cannot be read
+_FALLBACK_LANG_MAP = {
+    'japanese': 'ja',
+    'english': 'en',
+    'spanish': 'es',
+    'french': 'fr',
+    'german': 'de',
+    'chinese': 'zh'
+}
+
+# Response cache for chat_with_context: repeat questions against the same
+# transcript (same context/model/settings) are answered without an API call.
+_CONTEXT_CACHE_MAX_ENTRIES = 1024
+_CONTEXT_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_CONTEXT_CACHE_LOCK = threading.Lock()
+
+
+def _context_cache_key(
+    model: str,
+    question: str,
+    context_text: str,
+    system_message: str | None,
+    temperature: float
+) -> tuple:
+    # The context is usually a large transcript; key on its hash instead of
+    # holding a reference to the full text in the cache.
+    return (model, question, hash(context_text or ""), system_message, temperature)
+
+
+def _context_cache_get(key: tuple) -> str | None:
+    with _CONTEXT_CACHE_LOCK:
+        response = _CONTEXT_CACHE.get(key)
+        if response is not None:
+            _CONTEXT_CACHE.move_to_end(key)
+        return response
+
+
+def _context_cache_put(key: tuple, response: str) -> None:
+    with _CONTEXT_CACHE_LOCK:
+        _CONTEXT_CACHE[key] = response
+        _CONTEXT_CACHE.move_to_end(key)
+        while len(_CONTEXT_CACHE) > _CONTEXT_CACHE_MAX_ENTRIES:
+            _CONTEXT_CACHE.popitem(last=False)
+
+
+def _build_chat_messages(
+    message: str,
+    system_message: str | None,
+    history: list[dict[str, str]] | None
+) -> tuple[list[dict[str, str]], list[dict[str, str]]]:
+    """Assemble the request messages and the history to append results to."""
+    if history is None or len(history) == 0:
+        # First call: system + user
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": message})
+        new_history: list[dict[str, str]] = []
+    else:
+        # Subsequent calls
+        messages = history + [{"role": "user", "content": message}]
+        new_history = history.copy()
+
+    return messages, new_history
+
 
 class TranslationSegment(BaseModel):
     """Data model for translation segment with timestamp."""
@@ -67,19 +311,7 @@ def chat_completion(
     Returns:
         Tuple of (assistant_response, updated_history)
     """
-    openai.api_key = api_key
-
-    if history is None or len(history) == 0:
-        # First call: system + user
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": message})
-        new_history: list[dict[str, str]] = []
-    else:
-        # Subsequent calls
-        messages = history + [{"role": "user", "content": message}]
-        new_history = history.copy()
+    messages, new_history = _build_chat_messages(message, system_message, history)
 
     start_t = time.time()
     logger.info(
@@ -89,7 +321,7 @@ def chat_completion(
         temperature,
     )
 
-    resp = openai.chat.completions.create(
+    resp = _get_sync_client(api_key).chat.completions.create(
         model=model,
         messages=messages,
         temperature=temperature,
@@ -121,7 +353,10 @@ async def chat_completion_async(
 ) -> tuple[str, list[dict[str, str]]]:
     """
     Async chat completion with retry logic.
-    
+
+    Uses the async OpenAI client directly so the HTTP round-trip never
+    blocks the event loop and concurrent callers actually overlap.
+
     Args:
         api_key: OpenAI API key
         model: Model to use for chat
@@ -130,24 +365,73 @@ async def chat_completion_async(
         history: Previous conversation history
         temperature: Temperature for response generation
         max_retries: Maximum number of retries on failure
-        
+
     Returns:
         Tuple of (assistant_response, updated_history)
     """
+    messages, new_history = _build_chat_messages(message, system_message, history)
+    client = _get_async_client(api_key)
+
     for attempt in range(max_retries):
         try:
-            return chat_completion(api_key, model, message, system_message, history, temperature)
+            start_t = time.time()
+            logger.info(
+                "LLM chat_completion_async: model=%s messages=%d temperature=%.2f attempt=%d",
+                model,
+                len(messages),
+                temperature,
+                attempt + 1,
+            )
+
+            resp = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+            )
+
+            assistant_reply = resp.choices[0].message.content.strip()
+
+            logger.info(
+                "LLM chat_completion_async success: model=%s duration_ms=%d",
+                model,
+                int((time.time() - start_t) * 1000),
+            )
+
+            # Add latest user/assistant to history
+            new_history.append({"role": "user", "content": message})
+            new_history.append({"role": "assistant", "content": assistant_reply})
+
+            return assistant_reply, new_history
+
         except Exception as e:
             if attempt == max_retries - 1:
                 raise e
 
-            # Exponential backoff
-            wait_time = 2 ** attempt
-            await asyncio.sleep(wait_time)
+            await asyncio.sleep(_retry_wait_seconds(e, attempt))
 
     raise RuntimeError("Max retries exceeded")
 
 
+def _retry_wait_seconds(error: Exception, attempt: int) -> float:
+    """
+    Backoff delay before retry, honoring the API's Retry-After header.
+
+    Uses full-jitter exponential backoff so that many parallel requests
+    denied by the same rate limit do not wake in lockstep and re-hammer
+    the API together.
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        retry_after = getattr(response, "headers", {}).get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+    return random.uniform(0, min(30.0, 2 ** attempt))
+
+
 def chat_with_context(
     api_key: str,
     model: str,
@@ -191,7 +475,12 @@ def chat_with_context(
     if not model.strip():
         raise ValidationError("Model must be specified", field="model")
 
-    openai.api_key = api_key
+    # Serve repeat questions on the same transcript from the cache
+    cache_key = _context_cache_key(model, question, context_text, system_message, temperature)
+    cached_response = _context_cache_get(cache_key)
+    if cached_response is not None:
+        logger.info("LLM chat_with_context cache hit: model=%s q_chars=%d", model, len(question))
+        return cached_response
 
     def _chat_with_context():
         start_t = time.time()
@@ -203,7 +492,7 @@ def chat_with_context(
 
         # Step 2: Context injection
         if context_text and context_text.strip():
-            context_message = f"以下は文字起こしされたテキストです。この内容を参考にして質問に答えてください。\n\n{context_text}"
+            context_message = _CTX_PREFIX + context_text
             messages.append({"role": "user", "content": context_message})
 
         # Step 3: Actual question
@@ -217,7 +506,7 @@ def chat_with_context(
             len(question or ""),
         )
 
-        resp = openai.chat.completions.create(
+        resp = _get_sync_client(api_key).chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
@@ -231,7 +520,9 @@ def chat_with_context(
         return result
 
     try:
-        return safe_execute(_chat_with_context, error_context="chat with context")
+        response = safe_execute(_chat_with_context, error_context="chat with context")
+        _context_cache_put(cache_key, response)
+        return response
     except Exception as e:
         raise handle_openai_error(e)
 
@@ -258,8 +549,6 @@ def structured_completion(
     Returns:
         Parsed Python dictionary
     """
-    openai.api_key = api_key
-
     start_t = time.time()
     logger.info(
         "LLM structured_completion: model=%s temp=%.2f sys_chars=%d user_chars=%d",
@@ -269,7 +558,112 @@ def structured_completion(
         len(user_prompt or ""),
     )
 
-    # Base parameters
+    # Deterministic requests are served from the on-disk cache when possible
+    cache_key = None
+    if temperature <= 0.01:
+        cache_key = _structured_cache_key(model, system_prompt, user_prompt, json_schema, temperature)
+        cached = _structured_cache_get(cache_key)
+        if cached is not None:
+            logger.info("LLM structured_completion disk cache hit: model=%s", model)
+            return cached
+
+    params = _build_structured_params(model, system_prompt, user_prompt, json_schema, temperature)
+
+    resp = _get_sync_client(api_key).chat.completions.create(**params)
+
+    result = _finish_structured_completion(resp, model, start_t)
+    if cache_key is not None:
+        _structured_cache_put(cache_key, result)
+    return result
+
+
+async def structured_completion_async(
+    api_key: str,
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    json_schema: dict[str, Any],
+    temperature: float = 0.3,
+    on_first_token: Callable | None = None
+) -> dict[str, Any]:
+    """
+    Async variant of structured_completion using the cached async client.
+
+    Keeps the event loop free during the HTTP round-trip so concurrent
+    translation chunks actually overlap. When on_first_token is provided the
+    response is consumed as a stream and the callback fires as soon as the
+    first token arrives - callers use this to start the next request while
+    the current one is still decoding.
+
+    Args:
+        api_key: OpenAI API key
+        model: Model to use
+        system_prompt: System prompt
+        user_prompt: User prompt
+        json_schema: JSON schema for structured output
+        temperature: Temperature for response generation
+        on_first_token: Called once when the first response token arrives
+
+    Returns:
+        Parsed Python dictionary
+    """
+    start_t = time.time()
+    logger.info(
+        "LLM structured_completion_async: model=%s temp=%.2f sys_chars=%d user_chars=%d",
+        model,
+        temperature,
+        len(system_prompt or ""),
+        len(user_prompt or ""),
+    )
+
+    # Deterministic requests are served from the on-disk cache when possible
+    cache_key = None
+    if temperature <= 0.01:
+        cache_key = _structured_cache_key(model, system_prompt, user_prompt, json_schema, temperature)
+        cached = _structured_cache_get(cache_key)
+        if cached is not None:
+            logger.info("LLM structured_completion_async disk cache hit: model=%s", model)
+            if on_first_token:
+                on_first_token()
+            return cached
+
+    params = _build_structured_params(model, system_prompt, user_prompt, json_schema, temperature)
+    client = _get_async_client(api_key)
+
+    if on_first_token is None:
+        resp = await client.chat.completions.create(**params)
+        result = _finish_structured_completion(resp, model, start_t)
+    else:
+        stream = await client.chat.completions.create(stream=True, **params)
+        pieces: list[str] = []
+        first = True
+        async for event in stream:
+            if first:
+                first = False
+                on_first_token()
+            if event.choices and event.choices[0].delta.content:
+                pieces.append(event.choices[0].delta.content)
+
+        logger.info(
+            "LLM structured_completion_async success: model=%s duration_ms=%d",
+            model,
+            int((time.time() - start_t) * 1000),
+        )
+        result = _loads("".join(pieces))
+
+    if cache_key is not None:
+        _structured_cache_put(cache_key, result)
+    return result
+
+
+def _build_structured_params(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    json_schema: dict[str, Any],
+    temperature: float
+) -> dict[str, Any]:
+    """Build chat.completions parameters shared by the sync/async variants."""
     params: dict[str, Any] = {
         "model": model,
         "response_format": {
@@ -292,8 +686,11 @@ def structured_completion(
     if not is_gpt5:
         params["temperature"] = temperature
 
-    resp = openai.chat.completions.create(**params)
+    return params
+
 
+def _finish_structured_completion(resp: Any, model: str, start_t: float) -> dict[str, Any]:
+    """Log and parse a structured completion response."""
     # Debug logging
     logger.debug(f"Model: {model}")
     logger.debug(f"Usage: {resp.usage.prompt_tokens} prompt + {resp.usage.completion_tokens} completion tokens")
@@ -305,7 +702,7 @@ def structured_completion(
         model,
         int((time.time() - start_t) * 1000),
     )
-    return json.loads(content) if isinstance(content, str) else content
+    return _loads(content) if isinstance(content, str) else content
 
 
 def parse_transcript_to_json(transcript_text: str) -> list[dict[str, str]]:
@@ -325,48 +722,65 @@ def parse_transcript_to_json(transcript_text: str) -> list[dict[str, str]]:
     Returns:
         List of dictionaries with "ts" and "text" fields
     """
-    segments = []
-
-    # Split by timestamp lines and process pairs
-    lines = transcript_text.strip().split('\n')
-    current_timestamp = None
-    current_text_lines: list[str] = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check if line is a timestamp (starts with #)
-        if line.startswith('# '):
-            # Save previous segment if exists
-            if current_timestamp and current_text_lines:
-                text_content = '\n'.join(current_text_lines).strip()
-                if text_content:
-                    segments.append({
-                        "ts": current_timestamp.replace('# ', ''),
-                        "text": text_content
-                    })
-
-            # Start new segment
-            current_timestamp = line
-            current_text_lines = []
-        else:
-            # Accumulate text lines
-            current_text_lines.append(line)
+    lines = transcript_text.splitlines()
+
+    # Single pass to find timestamp boundaries, then slice content between
+    # them; avoids the per-line accumulator and trailing-flush bookkeeping.
+    # The precompiled regex captures the timestamp directly, replacing the
+    # startswith + whole-line replace('# ', '') pair.
+    headers = [
+        (i, match.group(1))
+        for i, line in enumerate(lines)
+        if (match := _TS_HEADER_RE.match(line))
+    ]
 
-    # Handle final segment
-    if current_timestamp and current_text_lines:
-        text_content = '\n'.join(current_text_lines).strip()
+    segments = []
+    for k, (start, ts) in enumerate(headers):
+        end = headers[k + 1][0] if k + 1 < len(headers) else len(lines)
+        text_content = '\n'.join(
+            stripped
+            for stripped in (line.strip() for line in lines[start + 1:end])
+            if stripped
+        )
         if text_content:
-            segments.append({
-                "ts": current_timestamp.replace('# ', ''),
-                "text": text_content
-            })
+            segments.append({"ts": ts, "text": text_content})
 
     return segments
 
 
+def parse_transcript_to_json_iter(file_obj: Iterable[str]) -> Iterator[dict[str, str]]:
+    """
+    Streaming variant of parse_transcript_to_json for file input.
+
+    Reads line by line and yields each segment as soon as it closes, so
+    callers can process multi-MB transcripts with O(one segment) peak
+    memory instead of materializing the whole file and segment list.
+
+    Args:
+        file_obj: Open text file (or any iterable of lines)
+
+    Yields:
+        Dictionaries with "ts" and "text" fields
+    """
+    current_ts = None
+    current_lines: list[str] = []
+
+    for line in file_obj:
+        match = _TS_HEADER_RE.match(line)
+        if match:
+            if current_ts is not None and current_lines:
+                yield {"ts": current_ts, "text": '\n'.join(current_lines)}
+            current_ts = match.group(1)
+            current_lines = []
+        elif current_ts is not None:
+            stripped = line.strip()
+            if stripped:
+                current_lines.append(stripped)
+
+    if current_ts is not None and current_lines:
+        yield {"ts": current_ts, "text": '\n'.join(current_lines)}
+
+
 def reconstruct_transcript_from_json(segments: list[dict[str, str]]) -> str:
     """
     Reconstruct transcript text from JSON format after translation.
@@ -384,25 +798,56 @@ def reconstruct_transcript_from_json(segments: list[dict[str, str]]) -> str:
     Returns:
         Reconstructed transcript text with timestamps
     """
-    result_lines = []
+    # Stream into a single buffer; writing the separator before each segment
+    # (instead of after) removes the trailing-blank-line trim pass entirely
+    buf = io.StringIO()
+    write_transcript_from_json(segments, buf)
+    return buf.getvalue()
+
+
+def write_transcript_from_json(segments: Iterable[dict[str, str]], buf) -> int:
+    """
+    Write reconstructed transcript text for segments into a text stream.
+
+    Streaming counterpart of reconstruct_transcript_from_json: segments go
+    straight to the target stream (e.g. an output file), so peak memory stays
+    at one segment instead of the whole transcript.
+
+    Args:
+        segments: Iterable of dictionaries with "ts" and "text" fields
+        buf: Writable text stream
+
+    Returns:
+        Number of segments written
+    """
+    count = 0
+    for i, segment in enumerate(segments):
+        if i:
+            # Blank line between segments
+            buf.write('\n\n')
 
-    for segment in segments:
-        # Add timestamp line
-        result_lines.append(f"# {segment['ts']}")
+        # Timestamp line
+        buf.write(f"# {segment['ts']}")
 
-        # Add text content
+        # Text content
         text = segment.get('text', '').strip()
         if text:
-            result_lines.append(text)
+            buf.write('\n')
+            buf.write(text)
 
-        # Add blank line between segments
-        result_lines.append('')
+        count += 1
 
-    # Remove trailing empty line
-    while result_lines and not result_lines[-1].strip():
-        result_lines.pop()
+    return count
 
-    return '\n'.join(result_lines)
+
+def _serialize_segments_json(segments: list[dict[str, str]]) -> str:
+    """
+    Serialize segments to a compact JSON array, encoding each segment once.
+
+    Avoids the intermediate wrapper dict and indent=2 pretty-printing, which
+    re-walked every segment and padded the prompt with whitespace tokens.
+    """
+    return "[" + ",\n".join(_dumps(segment) for segment in segments) + "]"
 
 
 async def translate_transcript_json(
@@ -411,7 +856,8 @@ async def translate_transcript_json(
     transcript_json: list[dict[str, str]],
     target_language: str,
     temperature: float = 0.3,
-    progress_callback: Callable | None = None
+    progress_callback: Callable | None = None,
+    on_first_token: Callable | None = None
 ) -> list[dict[str, str]]:
     """
     Translate transcript using JSON structured approach with retry logic.
@@ -427,14 +873,26 @@ async def translate_transcript_json(
         target_language: Target language for translation
         temperature: Temperature for translation
         progress_callback: Optional callback for progress updates
+        on_first_token: Forwarded to structured_completion_async
 
     Returns:
         List of translated segments with same structure
     """
-    openai.api_key = api_key
+    # Collapse duplicate texts (stock phrases, silence markers, speaker tags)
+    # so the prompt scales with unique content; re-expanded after translation.
+    unique_segments: list[dict[str, str]] = []
+    unique_index_by_text: dict[str, int] = {}
+    index_map: list[int] = []
+    for segment in transcript_json:
+        unique_index = unique_index_by_text.get(segment["text"])
+        if unique_index is None:
+            unique_index = len(unique_segments)
+            unique_index_by_text[segment["text"]] = unique_index
+            unique_segments.append(segment)
+        index_map.append(unique_index)
 
     # System prompt for translation with explicit instructions
-    num_segments = len(transcript_json)
+    num_segments = len(unique_segments)
 
     # Create JSON schema for structured output with strict segment count constraints
     json_schema = {
@@ -468,10 +926,12 @@ REQUIREMENTS:
 
 Output must be valid JSON following the provided schema with ALL {num_segments} segments included."""
 
-    # User prompt with JSON data
-    user_prompt = f"""Translate the following transcript segments. Only translate the "text" fields to {target_language}, keep "ts" fields unchanged:
-
-{json.dumps({"segments": transcript_json}, ensure_ascii=False, indent=2)}"""
+    # User prompt with JSON data (each segment is serialized exactly once)
+    user_prompt = (
+        f'Translate the following transcript segments. Only translate the "text" fields '
+        f'to {target_language}, keep "ts" fields unchanged:\n\n'
+        '{"segments": ' + _serialize_segments_json(unique_segments) + '}'
+    )
 
     if progress_callback:
         progress_callback(0.1, "Starting translation...")
@@ -500,13 +960,14 @@ Output must be valid JSON following the provided schema with ALL {num_segments}
                 progress_callback(0.3 + (attempt * 0.2), f"Translating... (attempt {attempt + 1})")
 
             # Use structured completion for guaranteed JSON output
-            result = structured_completion(
+            result = await structured_completion_async(
                 api_key=api_key,
                 model=model,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 json_schema=json_schema,
-                temperature=temperature
+                temperature=temperature,
+                on_first_token=on_first_token
             )
 
             if progress_callback:
@@ -514,28 +975,36 @@ Output must be valid JSON following the provided schema with ALL {num_segments}
 
             # Parse result and return segments
             if isinstance(result, str):
-                result = json.loads(result)
+                result = _loads(result)
 
             translated_segments = result.get("segments", [])
 
             # Debug logging for segment count
-            print(f"[DEBUG] Input segments: {len(transcript_json)}, Output segments: {len(translated_segments)}")
+            print(f"[DEBUG] Input segments: {len(unique_segments)}, Output segments: {len(translated_segments)}")
 
             # Validate result has same number of segments
-            if len(translated_segments) == len(transcript_json):
+            if len(translated_segments) == len(unique_segments):
                 print(f"[DEBUG] Translation successful on attempt {attempt + 1}")
                 if progress_callback:
                     progress_callback(1.0, "Translation completed!")
-                return translated_segments
+
+                if len(unique_segments) == len(transcript_json):
+                    return translated_segments
+
+                # Re-expand duplicates with each segment's original timestamp
+                return [
+                    {"ts": segment["ts"], "text": translated_segments[index_map[i]]["text"]}
+                    for i, segment in enumerate(transcript_json)
+                ]
             else:
                 # Log the mismatch for debugging
                 print(f"[DEBUG] Attempt {attempt + 1} failed: Missing segments")
-                print(f"[DEBUG] Last input segment: {transcript_json[-1]['ts']}")
+                print(f"[DEBUG] Last input segment: {unique_segments[-1]['ts']}")
                 if translated_segments:
                     print(f"[DEBUG] Last output segment: {translated_segments[-1]['ts']}")
 
                 last_error = ValidationError(
-                    f"Translation returned {len(translated_segments)} segments but expected {len(transcript_json)}",
+                    f"Translation returned {len(translated_segments)} segments but expected {len(unique_segments)}",
                     field="translation_result"
                 )
 
@@ -558,13 +1027,127 @@ async def translate_transcript_chunked(
     target_language: str,
     temperature: float = 0.3,
     segments_per_chunk: int = 10,
+    max_chars_per_chunk: int = 8000,
+    max_concurrency: int = 8,
     progress_callback: Callable | None = None
 ) -> list[dict[str, str]]:
     """
-    Translate transcripts by splitting into fixed-size chunks by segment count.
+    Translate transcripts by splitting into chunks by segment count.
 
     Always splits into chunks to improve success rate and handle large transcripts.
     Smaller chunks (fewer segments) generally have higher translation success rates.
+    A character budget per chunk additionally guards against context overflow for
+    unusually long (or CJK-dense) segments, which would otherwise force retries.
+    Chunks are dispatched concurrently (bounded by a semaphore) since the work
+    is network-latency bound; results are reassembled in chunk order.
+
+    Args:
+        api_key: OpenAI API key
+        model: Language model to use
+        transcript_json: List of segments to translate
+        target_language: Target language
+        temperature: Temperature for translation
+        segments_per_chunk: Number of segments per chunk (default: 10)
+        max_chars_per_chunk: Character budget per chunk (default: 8000)
+        max_concurrency: Maximum number of chunks translated in parallel (default: 8)
+        progress_callback: Optional callback for progress updates
+
+    Returns:
+        List of translated segments
+    """
+    if len(transcript_json) == 0:
+        return []
+
+    # Pack segments greedily: close a chunk at the segment limit or when the
+    # character budget would be exceeded, whichever comes first
+    chunks: list[list[dict[str, str]]] = []
+    current_chunk: list[dict[str, str]] = []
+    current_chars = 0
+
+    for segment in transcript_json:
+        segment_chars = len(segment["ts"]) + len(segment["text"])
+        if current_chunk and (
+            len(current_chunk) >= segments_per_chunk
+            or current_chars + segment_chars > max_chars_per_chunk
+        ):
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_chars = 0
+        current_chunk.append(segment)
+        current_chars += segment_chars
+
+    chunks.append(current_chunk)
+
+    total_chunks = len(chunks)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
+
+    async def _translate_chunk(chunk: list[dict[str, str]]) -> list[dict[str, str]]:
+        nonlocal completed
+
+        # The semaphore slot is released as soon as this chunk's first
+        # response token arrives, so the next chunk's request goes out while
+        # this one is still decoding - the semaphore bounds concurrent
+        # prefills, not whole request lifetimes.
+        await semaphore.acquire()
+        released = False
+
+        def _release_slot():
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        try:
+            chunk_result = await translate_transcript_json(
+                api_key, model, chunk, target_language,
+                temperature, None, on_first_token=_release_slot
+            )
+        finally:
+            _release_slot()
+
+        # Progress is reported by completion count, not dispatch order
+        # (counter updates are safe: all tasks run on the same event loop)
+        completed += 1
+        if progress_callback:
+            progress = (completed / total_chunks) * 0.9
+            progress_callback(progress, f"Translated chunk {completed}/{total_chunks}")
+
+        return chunk_result
+
+    # gather preserves input order, so segment order survives reassembly
+    chunk_results = await asyncio.gather(*[_translate_chunk(chunk) for chunk in chunks])
+
+    translated_segments = []
+    for chunk_result in chunk_results:
+        translated_segments.extend(chunk_result)
+
+    if progress_callback:
+        progress_callback(1.0, "All chunks translated!")
+
+    return translated_segments
+
+
+async def translate_transcript_multiplexed(
+    api_key: str,
+    model: str,
+    transcript_json: list[dict[str, str]],
+    target_language: str,
+    temperature: float = 0.3,
+    segments_per_chunk: int = 10,
+    tasks_per_request: int = 4,
+    max_concurrency: int = 8,
+    progress_callback: Callable | None = None
+) -> list[dict[str, str]]:
+    """
+    Translate transcripts by multiplexing several chunks into each request.
+
+    Where translate_transcript_chunked pays one HTTP request per chunk, this
+    variant packs up to tasks_per_request chunks into a single structured
+    output request - the right trade when throughput is limited by requests
+    per minute rather than tokens per minute. Buckets are still dispatched
+    concurrently under a semaphore, and a malformed multiplexed response
+    falls back to one request per chunk for that bucket only.
 
     Args:
         api_key: OpenAI API key
@@ -573,6 +1156,8 @@ async def translate_transcript_chunked(
         target_language: Target language
         temperature: Temperature for translation
         segments_per_chunk: Number of segments per chunk (default: 10)
+        tasks_per_request: Number of chunks packed into one request (default: 4)
+        max_concurrency: Maximum number of requests in flight (default: 8)
         progress_callback: Optional callback for progress updates
 
     Returns:
@@ -581,34 +1166,141 @@ async def translate_transcript_chunked(
     if len(transcript_json) == 0:
         return []
 
-    # Split into fixed-size chunks by segment count
     chunks = [
         transcript_json[i:i + segments_per_chunk]
         for i in range(0, len(transcript_json), segments_per_chunk)
     ]
+    buckets = [
+        chunks[i:i + tasks_per_request]
+        for i in range(0, len(chunks), tasks_per_request)
+    ]
 
-    # Translate chunks
-    translated_segments = []
-    total_chunks = len(chunks)
+    total_buckets = len(buckets)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    completed = 0
 
-    for i, chunk in enumerate(chunks):
+    async def _translate_bucket(bucket: list[list[dict[str, str]]]) -> list[list[dict[str, str]]]:
+        nonlocal completed
+        async with semaphore:
+            bucket_result = await _translate_bucket_request(
+                api_key, model, bucket, target_language, temperature
+            )
+
+        completed += 1
         if progress_callback:
-            progress = (i / total_chunks) * 0.9
-            progress_callback(progress, f"Translating chunk {i+1}/{total_chunks}")
+            progress = (completed / total_buckets) * 0.9
+            progress_callback(progress, f"Translated batch {completed}/{total_buckets}")
 
-        chunk_result = await translate_transcript_json(
-            api_key, model, chunk, target_language,
-            temperature, None
-        )
+        return bucket_result
 
-        translated_segments.extend(chunk_result)
+    bucket_results = await asyncio.gather(*[_translate_bucket(bucket) for bucket in buckets])
+
+    translated_segments = []
+    for bucket_result in bucket_results:
+        for chunk_result in bucket_result:
+            translated_segments.extend(chunk_result)
 
     if progress_callback:
-        progress_callback(1.0, "All chunks translated!")
+        progress_callback(1.0, "All batches translated!")
 
     return translated_segments
 
 
+async def _translate_bucket_request(
+    api_key: str,
+    model: str,
+    bucket: list[list[dict[str, str]]],
+    target_language: str,
+    temperature: float
+) -> list[list[dict[str, str]]]:
+    """Translate one bucket of chunks in a single multiplexed request."""
+    num_batches = len(bucket)
+
+    json_schema = {
+        "type": "object",
+        "properties": {
+            "batches": {
+                "type": "array",
+                "minItems": num_batches,
+                "maxItems": num_batches,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "idx": {"type": "integer"},
+                        "segments": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "ts": {"type": "string"},
+                                    "text": {"type": "string"}
+                                },
+                                "required": ["ts", "text"]
+                            }
+                        }
+                    },
+                    "required": ["idx", "segments"]
+                }
+            }
+        },
+        "required": ["batches"]
+    }
+
+    system_prompt = f"""You are a professional translator. Your task is critical and requires precision.
+
+REQUIREMENTS:
+1. You are given {num_batches} INDEPENDENT transcript batches, each with an "idx" and its "segments"
+2. Translate ONLY the "text" field of every segment to {target_language}
+3. Keep every "ts" field and every "idx" EXACTLY unchanged
+4. Each returned batch MUST contain the same number of segments as its input batch
+5. Maintain natural flow and consistency within each batch
+
+Output must be valid JSON following the provided schema with ALL {num_batches} batches included."""
+
+    batches_payload = ",\n".join(
+        f'{{"idx": {i}, "segments": ' + _serialize_segments_json(chunk) + "}"
+        for i, chunk in enumerate(bucket)
+    )
+    user_prompt = (
+        f'Translate the following independent transcript batches. Only translate the "text" '
+        f'fields to {target_language}, keep "ts" and "idx" fields unchanged:\n\n'
+        '{"batches": [' + batches_payload + ']}'
+    )
+
+    result = await structured_completion_async(
+        api_key=api_key,
+        model=model,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        json_schema=json_schema,
+        temperature=temperature
+    )
+
+    if isinstance(result, str):
+        result = _loads(result)
+
+    batches = sorted(result.get("batches", []), key=lambda batch: batch.get("idx", 0))
+
+    if len(batches) == num_batches and all(
+        len(batch.get("segments", [])) == len(chunk)
+        for batch, chunk in zip(batches, bucket, strict=True)
+    ):
+        return [batch["segments"] for batch in batches]
+
+    # Malformed multiplexed response: retry this bucket one chunk at a time
+    logger.warning(
+        "Multiplexed translation returned %d/%d well-formed batches; retrying per chunk",
+        len(batches),
+        num_batches,
+    )
+    return [
+        await translate_transcript_json(
+            api_key, model, chunk, target_language, temperature, None
+        )
+        for chunk in bucket
+    ]
+
+
 async def translate_transcript_full(
     api_key: str,
     model: str,
@@ -642,6 +1334,22 @@ async def translate_transcript_full(
     """
     start_time = time.time()
 
+    # Trivial cases never need the parse -> translate -> reconstruct pipeline:
+    # an empty transcript or source == target translates to itself, with zero
+    # OpenAI calls.
+    src = get_language_code(source_language)
+    tgt = get_language_code(target_language)
+    if not transcript_text.strip() or (src == tgt and src != "auto"):
+        if progress_callback:
+            progress_callback(1.0, "Translation completed!")
+        return TranslationResult(
+            original_text=transcript_text,
+            translated_text=transcript_text,
+            target_language=target_language,
+            processing_time=time.time() - start_time,
+            segment_count=transcript_text.count('# ')
+        )
+
     # Load default segments_per_chunk from config if not provided
     if segments_per_chunk is None:
         config = load_config()
@@ -705,16 +1413,7 @@ def get_language_code(language_name: str) -> str:
         translation_languages = config.get('translation_languages', {})
         return translation_languages.get(language_name, language_name.lower())
     except (FileNotFoundError, ValueError, KeyError):
-        # Fallback to common language codes
-        language_map = {
-            'japanese': 'ja',
-            'english': 'en',
-            'spanish': 'es',
-            'french': 'fr',
-            'german': 'de',
-            'chinese': 'zh'
-        }
-        return language_map.get(language_name.lower(), language_name.lower())
+        return _FALLBACK_LANG_MAP.get(language_name.lower(), language_name.lower())
 
 
 # CLI Interface Implementation (INITIAL.md requirement)
@@ -839,21 +1538,29 @@ def main():
 
         elif args.command == "parse":
             # Parse transcript to JSON
-            with open(args.input, encoding='utf-8') as f:
-                transcript_text = f.read()
-
-            segments = parse_transcript_to_json(transcript_text)
-
             if args.output:
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump({"segments": segments}, f, ensure_ascii=False, indent=2)
+                # Stream file-to-file so peak memory is one segment, not the
+                # whole transcript plus its parsed list
+                num_segments = 0
+                with open(args.input, encoding='utf-8') as src, \
+                        open(args.output, 'w', encoding='utf-8') as dst:
+                    dst.write('{"segments": [\n')
+                    for segment in parse_transcript_to_json_iter(src):
+                        if num_segments:
+                            dst.write(',\n')
+                        dst.write(_dumps(segment))
+                        num_segments += 1
+                    dst.write('\n]}')
                 print(f"JSON saved to: {args.output}")
             else:
+                with open(args.input, encoding='utf-8') as f:
+                    segments = parse_transcript_to_json(f.read())
+                num_segments = len(segments)
                 print("Parsed JSON:")
                 print("=" * 50)
                 print(json.dumps({"segments": segments}, ensure_ascii=False, indent=2))
 
-            print(f"Found {len(segments)} segments")
+            print(f"Found {num_segments} segments")
 
         elif args.command == "reconstruct":
             # Reconstruct from JSON
@@ -861,16 +1568,18 @@ def main():
                 data = json.load(f)
 
             segments = data.get("segments", [])
-            transcript_text = reconstruct_transcript_from_json(segments)
 
             if args.output:
+                # Write lines straight to the output file instead of building
+                # the full transcript string first (stdlib json has no
+                # incremental reader, so only the output side streams)
                 with open(args.output, 'w', encoding='utf-8') as f:
-                    f.write(transcript_text)
+                    write_transcript_from_json(segments, f)
                 print(f"Transcript saved to: {args.output}")
             else:
                 print("Reconstructed Transcript:")
                 print("=" * 50)
-                print(transcript_text)
+                print(reconstruct_transcript_from_json(segments))
 
             print(f"Reconstructed {len(segments)} segments")
 
@@ -19,6 +19,14 @@ DEFAULT_LEVELS = {
     "mock-ui": logging.DEBUG,
 }
 
+# Third-party loggers reduced to WARNING; muted once per process
+_NOISY = ("urllib3", "openai", "gradio")
+_NOISE_MUTED = False
+
+# Handlers created per environment, reused on re-initialization so repeated
+# init_logging calls (e.g. per-test fixtures) do not mkdir or reopen log files
+_INIT_STATE: dict[str, tuple[logging.Handler, ...]] = {}
+
 
 def _parse_level(level_str: str | None, default: int) -> int:
     if not level_str:
@@ -46,7 +54,18 @@ def init_logging(app_env: str | None = None) -> logging.Logger:
 
     root = logging.getLogger()
 
-    # If already configured (handlers exist), just set level and return
+    # Re-initialization for a known environment: reuse the cached handlers
+    # (re-attaching them if a reset removed them) instead of opening new fds
+    cached = _INIT_STATE.get(env)
+    if cached is not None:
+        root.setLevel(level)
+        for handler in cached:
+            handler.setLevel(level)
+            if handler not in root.handlers:
+                root.addHandler(handler)
+        return logging.getLogger(__name__)
+
+    # If already configured elsewhere (handlers exist), just set level and return
     if root.handlers:
         root.setLevel(level)
         return logging.getLogger(__name__)
@@ -62,6 +81,7 @@ def init_logging(app_env: str | None = None) -> logging.Logger:
     console.setLevel(level)
     console.setFormatter(formatter)
     root.addHandler(console)
+    handlers: list[logging.Handler] = [console]
 
     # File handler
     log_dir = Path("logs")
@@ -72,15 +92,21 @@ def init_logging(app_env: str | None = None) -> logging.Logger:
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         root.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         # Fall back to console-only if file logging cannot be initialized
         logging.getLogger(__name__).warning(
             f"File logging disabled (failed to init logs dir/file): {e}"
         )
 
-    # Reduce noise from third-party libraries
-    for noisy in ("urllib3", "openai", "gradio"):
-        logging.getLogger(noisy).setLevel(logging.WARNING)
+    _INIT_STATE[env] = tuple(handlers)
+
+    # Reduce noise from third-party libraries (once per process)
+    global _NOISE_MUTED
+    if not _NOISE_MUTED:
+        for noisy in _NOISY:
+            logging.getLogger(noisy).setLevel(logging.WARNING)
+        _NOISE_MUTED = True
 
     return logging.getLogger(__name__)
 
@@ -8,19 +8,81 @@ real-time progress updates and retry logic with exponential backoff.
 import argparse
 import asyncio
 import os
+import re
+import shutil
 import tempfile
 import time
 from collections.abc import Callable
 from pathlib import Path
 
-import openai
 from pydantic import BaseModel
 
-from .util import format_duration, split_audio
+from .errors import (
+    APIError,
+    NetworkError,
+    TranscriberError,
+    handle_openai_error,
+    validate_api_key,
+    validate_file_path,
+)
+
+# Reuse the LLM module's cached OpenAI clients (and their pooled HTTP
+# connections) and its retry wait policy rather than duplicating them here.
+from .llm import _get_async_client, _get_sync_client, _retry_wait_seconds
+from .util import cleanup_chunks, format_duration, iter_split_audio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Timestamp header pattern (# HH:MM:SS --> HH:MM:SS), compiled once since
+# display formatting runs on every UI refresh
+_TS_RE = re.compile(r'# (\d{2}:\d{2}:\d{2}) --> (\d{2}:\d{2}:\d{2})')
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for proactive request pacing.
+
+    Gates calls to a target requests-per-minute rate before they hit the
+    network, so bursts of chunk uploads do not blow through the API quota
+    and waste time in 429/backoff cycles. State updates are safe without a
+    lock: acquire never awaits between reading and spending tokens, and all
+    callers share one event loop.
+    """
+
+    def __init__(self, rpm: int):
+        self.capacity = float(rpm)
+        self.refill_rate = rpm / 60.0  # tokens per second
+        self.tokens = float(rpm)
+        self.last = time.monotonic()
+
+    async def acquire(self, n: float = 1.0) -> None:
+        """Wait until n tokens are available, then spend them."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+            self.last = now
+
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+
+            await asyncio.sleep((n - self.tokens) / self.refill_rate)
+
+
+# Limiters cached per (api_key, model, rpm) so refill state carries across
+# jobs in the same process instead of resetting every transcription
+_RATE_LIMITERS: dict[tuple[str, str, int], AsyncTokenBucket] = {}
+
+
+def _get_rate_limiter(api_key: str, model: str, rpm: int) -> AsyncTokenBucket:
+    """Return the shared token bucket for the given API key, model and RPM."""
+    key = (api_key, model, rpm)
+    bucket = _RATE_LIMITERS.get(key)
+    if bucket is None:
+        bucket = _RATE_LIMITERS.setdefault(key, AsyncTokenBucket(rpm))
+    return bucket
+
 
 class TranscriptionChunk(BaseModel):
     """Data model for transcription chunk."""
@@ -58,14 +120,12 @@ def transcribe(
     Returns:
         Transcribed text
     """
-    openai.api_key = api_key
-
     p = Path(audio_path)
     if not p.exists():
         raise FileNotFoundError(f"Audio file not found: {p}")
 
     with p.open("rb") as f:
-        resp = openai.audio.transcriptions.create(
+        resp = _get_sync_client(api_key).audio.transcriptions.create(
             model=model,
             file=f,
             language=None if language == "auto" else language,
@@ -96,20 +156,11 @@ async def transcribe_single_chunk(
     Returns:
         Dictionary with transcription result and metadata
     """
-    from .errors import (
-        APIError,
-        NetworkError,
-        handle_openai_error,
-        safe_execute,
-        validate_api_key,
-        validate_file_path,
-    )
-
     # Validate inputs
     validate_api_key(api_key)
     validate_file_path(chunk_path, must_exist=True)
 
-    openai.api_key = api_key
+    client = _get_async_client(api_key)
 
     # Retry logic with exponential backoff
     max_retries = 3
@@ -117,85 +168,68 @@ async def transcribe_single_chunk(
 
     for attempt in range(max_retries):
         try:
-            def _transcribe_chunk():
-                with open(chunk_path, "rb") as f:
-                    # Use tempfile.SpooledTemporaryFile for memory efficiency
-                    with tempfile.SpooledTemporaryFile() as temp_file:
-                        temp_file.write(f.read())
-                        temp_file.seek(0)
-
-                        response_format = "verbose_json" if include_timestamps else "text"
-
-                        logger.info(
-                            "LLM transcribe_chunk: model=%s fmt=%s file=%s",
-                            model,
-                            response_format,
-                            chunk_path,
-                        )
-
-                        start_t = time.time()
-                        resp = openai.audio.transcriptions.create(
-                            model=model,
-                            file=(Path(chunk_path).name, temp_file),
-                            language=None if language == "auto" else language,
-                            temperature=temperature,
-                            response_format=response_format
-                        )
-
-                        if include_timestamps and hasattr(resp, 'segments'):
-                            result_obj = {
-                                'text': resp.text,
-                                'segments': resp.segments,
-                                'duration': getattr(resp, 'duration', 0),
-                                'language': getattr(resp, 'language', language)
-                            }
-                        else:
-                            result_obj = {
-                                'text': resp if isinstance(resp, str) else resp.text,
-                                'segments': [],
-                                'duration': 0,
-                                'language': language
-                            }
-
-                        logger.info(
-                            "LLM transcribe_chunk success: model=%s duration_ms=%d chars=%d",
-                            model,
-                            int((time.time() - start_t) * 1000),
-                            len(result_obj.get('text', '') or ''),
-                        )
-                        return result_obj
-
-            return safe_execute(_transcribe_chunk, error_context=f"transcribing chunk {chunk_path}")
-
-        except (APIError, NetworkError) as e:
-            last_error = e
-
-            # Don't retry on authentication or quota errors
-            if hasattr(e, 'status_code') and e.status_code in [401, 402, 403]:
-                raise e
-
-            if attempt == max_retries - 1:
-                raise e
-
-            # Exponential backoff: wait 2^attempt seconds
-            wait_time = 2 ** attempt
-            await asyncio.sleep(wait_time)
+            response_format = "verbose_json" if include_timestamps else "text"
+
+            logger.info(
+                "LLM transcribe_chunk: model=%s fmt=%s file=%s",
+                model,
+                response_format,
+                chunk_path,
+            )
+
+            start_t = time.time()
+            # Await the async client directly: a sync call here would block
+            # the event loop and serialize the concurrent chunk gather.
+            # The on-disk file handle is streamed straight to HTTP (no
+            # intermediate in-memory copy); chunks are always exported as MP3.
+            with open(chunk_path, "rb") as f:
+                resp = await client.audio.transcriptions.create(
+                    model=model,
+                    file=(Path(chunk_path).name, f, "audio/mpeg"),
+                    language=None if language == "auto" else language,
+                    temperature=temperature,
+                    response_format=response_format
+                )
+
+            if include_timestamps and hasattr(resp, 'segments'):
+                result_obj = {
+                    'text': resp.text,
+                    'segments': resp.segments,
+                    'duration': getattr(resp, 'duration', 0),
+                    'language': getattr(resp, 'language', language)
+                }
+            else:
+                result_obj = {
+                    'text': resp if isinstance(resp, str) else resp.text,
+                    'segments': [],
+                    'duration': 0,
+                    'language': language
+                }
+
+            logger.info(
+                "LLM transcribe_chunk success: model=%s duration_ms=%d chars=%d",
+                model,
+                int((time.time() - start_t) * 1000),
+                len(result_obj.get('text', '') or ''),
+            )
+            return result_obj
 
         except Exception as e:
-            # Convert to appropriate error type
-            api_error = handle_openai_error(e)
+            # Classify once: our own error types pass through, anything else
+            # (e.g. raw OpenAI exceptions) is converted to an APIError
+            api_error = e if isinstance(e, (APIError, NetworkError)) else handle_openai_error(e)
             last_error = api_error
 
-            # Don't retry on authentication or quota errors
-            if hasattr(api_error, 'status_code') and api_error.status_code in [401, 402, 403]:
+            # Don't retry on authentication/quota errors or once retries
+            # are exhausted
+            status = getattr(api_error, 'status_code', None)
+            if status in (401, 402, 403) or attempt == max_retries - 1:
                 raise api_error
 
-            if attempt == max_retries - 1:
-                raise api_error
-
-            # Exponential backoff: wait 2^attempt seconds
-            wait_time = 2 ** attempt
-            await asyncio.sleep(wait_time)
+            # Jittered backoff (honoring Retry-After when the original
+            # exception carries one) so concurrent chunks denied by the same
+            # rate limit do not retry in lockstep
+            await asyncio.sleep(_retry_wait_seconds(e, attempt))
 
     # Should not reach here, but just in case
     raise last_error or APIError("Max retries exceeded", api_name="OpenAI")
@@ -210,17 +244,19 @@ async def transcribe_chunked(
     temperature: float = 0.0,
     include_timestamps: bool = True,
     progress_callback: Callable | None = None,
-    job_dir: str | None = None
+    job_dir: str | None = None,
+    max_concurrency: int = 8,
+    rpm: int = 50
 ) -> TranscriptionResult:
     """
     Transcribe large audio file using chunked processing with progress reporting.
-    
+
     Implements the 4-step processing sequence from INITIAL.md:
     1. Split audio into chunks with pydub
-    2. Transcribe chunks with yield-based progress
-    3. Real-time updates during processing  
+    2. Transcribe chunks concurrently with completion-based progress
+    3. Real-time updates during processing
     4. Merge results intelligently
-    
+
     Args:
         audio_path: Path to input audio file
         api_key: OpenAI API key
@@ -231,82 +267,167 @@ async def transcribe_chunked(
         include_timestamps: Whether to include timestamps
         progress_callback: Optional callback for progress updates
         job_dir: Optional job directory to save split audio files
-        
+        max_concurrency: Maximum number of chunks transcribed in parallel (default: 8)
+        rpm: Proactive requests-per-minute cap (default: 50, Whisper tier-1)
+
     Returns:
         TranscriptionResult with complete transcription
     """
     start_time = time.time()
 
-    # Step 1: Split audio into chunks
+    # Steps 1+2 run as a producer/consumer pipeline: each chunk's upload
+    # starts as soon as ffmpeg finishes cutting it, while the next chunk is
+    # still being produced, so the split latency hides behind the network.
+    # Transcription itself is network-latency bound, so chunks overlap under
+    # a semaphore (bounded for OpenAI RPM limits) instead of paying the
+    # per-request round-trip serially.
     if progress_callback:
         progress_callback(0.1, "Splitting audio into chunks...")
 
-    chunks, temp_dir = split_audio(audio_path, chunk_minutes, overlap_seconds=2)
-    total_chunks = len(chunks)
+    temp_dir = tempfile.mkdtemp()
+    logger.info(f"Created temporary directory for chunks: {temp_dir}")
 
-    # Step 2: Transcribe chunks with progress
-    results = []
-    chunk_objects = []
+    # Contiguous chunks: verbose_json durations give exact timestamp
+    # bookkeeping without overlap, and zero overlap lets the splitter run
+    # as a single ffmpeg segment-muxer pass
+    overlap_seconds = 0
+    chunks: list[str] = []
+    total_chunks = 0
 
-    for i, chunk_path in enumerate(chunks):
-        logger.info(f"Processing chunk {i+1}/{total_chunks}: {chunk_path}")
-        if progress_callback:
-            progress_percent = 0.1 + (i / total_chunks) * 0.8  # 10% to 90%
-            progress_callback(progress_percent, f"Processing chunk {i+1}/{total_chunks}")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    rate_limiter = _get_rate_limiter(api_key, model, rpm)
+    completed = 0
 
-        try:
+    async def _transcribe_chunk_task(i: int, chunk_path: str) -> tuple[int, dict]:
+        nonlocal completed
+        logger.info(f"Processing chunk {i+1}/{total_chunks}: {chunk_path}")
+        async with semaphore:
+            # Pace requests to the configured RPM before hitting the network
+            await rate_limiter.acquire()
             result = await transcribe_single_chunk(
                 chunk_path, api_key, model, language, temperature, include_timestamps
             )
 
-            # Create chunk object
-            chunk_obj = TranscriptionChunk(
-                chunk_id=f"chunk_{i+1:02d}",
-                start_time=i * chunk_minutes * 60,  # Approximate start time
-                end_time=(i + 1) * chunk_minutes * 60,  # Approximate end time
-                text=result['text'],
-                confidence=None  # OpenAI doesn't provide confidence scores
-            )
+        # Progress is reported by completion count, not dispatch order
+        # (counter updates are safe: all tasks run on the same event loop)
+        completed += 1
+        if progress_callback:
+            progress_percent = 0.1 + (completed / total_chunks) * 0.8  # 10% to 90%
+            progress_callback(progress_percent, f"Processed chunk {completed}/{total_chunks}")
 
-            chunk_objects.append(chunk_obj)
-            results.append(result)
+        return i, result
 
-        except Exception as e:
-            # Clean up partial chunks on error
-            from .util import cleanup_chunks
-            cleanup_chunks(chunks, temp_dir)
+    # Consume chunks as the splitter produces them, dispatching each upload
+    # immediately; task order matches chunk order for reassembly
+    tasks: list[asyncio.Task] = []
+    try:
+        async for i, total, chunk_path in iter_split_audio(
+            audio_path, chunk_minutes, overlap_seconds=overlap_seconds, temp_dir=temp_dir
+        ):
+            total_chunks = total
+            chunks.append(chunk_path)
+            tasks.append(asyncio.create_task(_transcribe_chunk_task(i, chunk_path)))
+    except Exception:
+        # Splitting failed midway: stop in-flight uploads and clean up
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        cleanup_chunks(chunks, temp_dir)
+        raise
+
+    # Await completions as they arrive so the first hard failure (retries are
+    # already exhausted inside transcribe_single_chunk) cancels the still-
+    # outstanding uploads immediately instead of letting them burn API quota
+    results_by_idx: dict[int, dict] = {}
+    try:
+        for coro in asyncio.as_completed(tasks):
+            idx, result = await coro
+            results_by_idx[idx] = result
+    except BaseException as e:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Clean up partial chunks on error
+        cleanup_chunks(chunks, temp_dir)
+
+        if isinstance(e, TranscriberError):
+            raise
+        # Recover the failing chunk's index for the error message
+        failed = next(
+            (i for i, task in enumerate(tasks)
+             if task.done() and not task.cancelled() and task.exception() is e),
+            None,
+        )
+        label = f"chunk {failed + 1}" if failed is not None else "chunk"
+        raise APIError(f"Failed to transcribe {label}: {str(e)}", api_name="OpenAI")
 
-            from .errors import APIError, TranscriberError
+    results = []
+    chunk_objects = []
+    current_start = 0.0
+
+    for i in range(len(tasks)):
+        result = results_by_idx[i]
+
+        # Use the actual audio duration the API reported (verbose_json)
+        # rather than assuming every chunk is exactly chunk_minutes long;
+        # consecutive chunks share overlap_seconds of audio
+        duration = result.get('duration') or chunk_minutes * 60
+        chunk_obj = TranscriptionChunk(
+            chunk_id=f"chunk_{i+1:02d}",
+            start_time=current_start,
+            end_time=current_start + duration,
+            text=result['text'],
+            confidence=None  # OpenAI doesn't provide confidence scores
+        )
+        current_start += duration - (overlap_seconds if duration > overlap_seconds else 0)
 
-            if isinstance(e, TranscriberError):
-                raise e
-            else:
-                raise APIError(f"Failed to transcribe chunk {i+1}: {str(e)}", api_name="OpenAI")
+        chunk_objects.append(chunk_obj)
+        results.append(result)
 
     # Step 3: Merge overlapping chunks intelligently
     if progress_callback:
         progress_callback(0.9, "Merging transcription results...")
 
-    merged_text = merge_transcription_results(results, include_timestamps, chunk_minutes)
+    merged_text = merge_transcription_results(
+        results, include_timestamps, chunk_minutes, overlap_seconds
+    )
 
     # Calculate statistics
     word_count = len(merged_text.split())
     processing_time = time.time() - start_time
 
-    # Copy chunks to job directory if specified
+    # Archive chunks to the job directory if specified. Runs in worker
+    # threads so the disk I/O does not block concurrent jobs on this event
+    # loop; on the same filesystem a hard link archives without copying.
     if job_dir:
-        import shutil
-        for chunk_path in chunks:
+        try:
+            same_fs = os.stat(temp_dir).st_dev == os.stat(job_dir).st_dev
+        except OSError:
+            same_fs = False
+        link_or_copy = os.link if same_fs else shutil.copy2
+
+        def _archive_chunk(chunk_path: str) -> None:
+            dest_path = os.path.join(job_dir, os.path.basename(chunk_path))
             try:
-                chunk_filename = os.path.basename(chunk_path)
-                dest_path = os.path.join(job_dir, chunk_filename)
+                link_or_copy(chunk_path, dest_path)
+            except OSError:
+                if link_or_copy is shutil.copy2:
+                    raise
+                # Hard link refused (e.g. bind mount, existing file): copy
                 shutil.copy2(chunk_path, dest_path)
-                logger.info(f"Saved chunk to job directory: {dest_path}")
-            except Exception as e:
-                logger.warning(f"Failed to copy chunk {chunk_path} to job directory: {e}")
+            logger.info(f"Saved chunk to job directory: {dest_path}")
+
+        archived = await asyncio.gather(
+            *[asyncio.to_thread(_archive_chunk, p) for p in chunks],
+            return_exceptions=True,
+        )
+        for chunk_path, outcome in zip(chunks, archived, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Failed to copy chunk {chunk_path} to job directory: {outcome}")
 
     # Cleanup temporary files
-    from .util import cleanup_chunks
     cleanup_chunks(chunks, temp_dir)
 
     if progress_callback:
@@ -315,7 +436,7 @@ async def transcribe_chunked(
     return TranscriptionResult(
         text=merged_text,
         chunks=chunk_objects,
-        total_duration=len(chunk_objects) * chunk_minutes * 60,  # Approximate
+        total_duration=chunk_objects[-1].end_time if chunk_objects else 0.0,
         word_count=word_count,
         processing_time=processing_time
     )
@@ -324,43 +445,82 @@ async def transcribe_chunked(
 def merge_transcription_results(
     results: list[dict],
     include_timestamps: bool = True,
-    chunk_minutes: int = 5
+    chunk_minutes: int = 5,
+    overlap_seconds: int = 2
 ) -> str:
     """
     Merge overlapping chunk transcription results intelligently.
-    
+
+    Timestamps track the audio duration each chunk actually covered (as
+    reported by the API's verbose_json response) rather than assuming every
+    chunk is exactly chunk_minutes long, which would drift on the overlap
+    and on the shorter final chunk. When a chunk carries segment-level
+    timestamps, its text is sliced back into chunk_minutes-sized sections,
+    so packed uploads (several planned chunks sent as one request) still
+    render at the section density the user's chunk_minutes setting asks for.
+
     Args:
         results: List of transcription results from chunks
         include_timestamps: Whether to include timestamps in output
-        chunk_minutes: Duration of each chunk in minutes
-        
+        chunk_minutes: Timestamp section length in minutes (also the
+            fallback chunk duration when a result carries no reported one)
+        overlap_seconds: Audio shared by consecutive chunks in seconds
+
     Returns:
         Merged transcription text with proper formatting
     """
     if not results:
         return ""
 
-    merged_segments = []
-    current_time = 0
-
-    for i, result in enumerate(results):
-        text = result.get('text', '').strip()
-        if not text:
-            continue
-
-        if include_timestamps:
-            # Format with timestamp as per INITIAL.md: # HH:MM:SS --> HH:MM:SS
-            chunk_duration_seconds = chunk_minutes * 60
-            start_time = format_duration(current_time)
-            end_time = format_duration(current_time + chunk_duration_seconds)
-
-            segment = f"# {start_time} --> {end_time}\n{text}"
-            merged_segments.append(segment)
-            current_time += chunk_duration_seconds  # Move forward by actual chunk duration
-        else:
-            merged_segments.append(text)
-
-    return "\n\n".join(merged_segments)
+    chunk_duration_seconds = chunk_minutes * 60
+
+    def _sections(result, chunk_start, duration):
+        """Yield (start, end, text) sections of at most chunk_minutes each."""
+        segments = result.get('segments') or []
+        if not segments:
+            # No segment timestamps: emit the chunk as a single section
+            if text := result.get('text', '').strip():
+                yield chunk_start, chunk_start + duration, text
+            return
+
+        # Bucket segments into chunk_minutes-sized windows relative to the
+        # chunk start (segment times are chunk-relative in verbose_json)
+        windows: dict[int, list[str]] = {}
+        for segment in segments:
+            if isinstance(segment, dict):
+                seg_start = segment.get('start') or 0.0
+                seg_text = segment.get('text') or ''
+            else:
+                seg_start = getattr(segment, 'start', None) or 0.0
+                seg_text = getattr(segment, 'text', '') or ''
+            if not (seg_text := seg_text.strip()):
+                continue
+            windows.setdefault(int(seg_start // chunk_duration_seconds), []).append(seg_text)
+
+        for window, texts in sorted(windows.items()):
+            start = chunk_start + window * chunk_duration_seconds
+            end = min(start + chunk_duration_seconds, chunk_start + duration)
+            yield start, end, ' '.join(texts)
+
+    def _segments():
+        current_time = 0.0
+        for result in results:
+            duration = result.get('duration') or chunk_duration_seconds
+            chunk_start = current_time
+            # The next chunk started overlap_seconds before this one ended;
+            # time advances even for chunks that transcribed to nothing
+            current_time += duration - (overlap_seconds if duration > overlap_seconds else 0)
+
+            if not include_timestamps:
+                if text := result.get('text', '').strip():
+                    yield text
+                continue
+
+            for start, end, text in _sections(result, chunk_start, duration):
+                # Format with timestamp as per INITIAL.md: # HH:MM:SS --> HH:MM:SS
+                yield f"# {format_duration(start)} --> {format_duration(end)}\n{text}"
+
+    return "\n\n".join(_segments())
 
 
 def format_transcript_for_display(transcript: str) -> str:
@@ -375,18 +535,11 @@ def format_transcript_for_display(transcript: str) -> str:
     Returns:
         HTML-formatted transcript
     """
-    import re
-
     # Convert timestamp format # HH:MM:SS --> HH:MM:SS to HTML spans
-    timestamp_pattern = r'# (\d{2}:\d{2}:\d{2}) --> (\d{2}:\d{2}:\d{2})'
-
-    def replace_timestamp(match):
-        start_time = match.group(1)
-        end_time = match.group(2)
-        return f'<span class="timestamp"># {start_time} --> {end_time}</span>'
-
-    formatted = re.sub(timestamp_pattern, replace_timestamp, transcript)
-    return formatted
+    return _TS_RE.sub(
+        lambda m: f'<span class="timestamp"># {m.group(1)} --> {m.group(2)}</span>',
+        transcript,
+    )
 
 
 # CLI Interface Implementation (INITIAL.md requirement)
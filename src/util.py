@@ -4,23 +4,46 @@ Audio utilities for transcriber web app.
 Memory-efficient audio processing with chunking support for large files.
 """
 
+import asyncio
+import copy
+import functools
+import json
 import os
+import subprocess
 import tempfile
 
 import yaml
-from pydub import AudioSegment
+
+try:
+    # libyaml-backed loader (~10x faster); falls back to pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Absolute project root (one level up from src), computed once at import
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Parsed-config cache keyed by path, invalidated when the file's mtime changes
+_CONFIG_CACHE: dict[str, tuple[float, dict]] = {}
+
 
 def load_config(config_path: str = None) -> dict:
     """
     Load configuration from YAML file.
-    
+
+    The parsed result is cached per path and re-read only when the file
+    changes on disk, so repeated handler construction does not re-parse
+    identical YAML. Each call returns its own deep copy, so callers (e.g.
+    AppConfig applying env overrides) can mutate the result freely without
+    poisoning the cache.
+
     Args:
         config_path: Path to config.yaml file (default: auto-detect)
-        
+
     Returns:
         Configuration dictionary
     """
@@ -39,10 +62,19 @@ def load_config(config_path: str = None) -> dict:
             current_dir = os.path.dirname(__file__)
             config_path = os.path.join(current_dir, "config.yaml")
 
+    # Serve the cached parse while the file is unchanged
+    try:
+        config_mtime = os.path.getmtime(config_path)
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == config_mtime:
+            return copy.deepcopy(cached[1])
+    except OSError:
+        config_mtime = None  # open below raises the proper ConfigurationError
+
     try:
         def _load_yaml():
             with open(config_path, encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)
 
             # Validate required configuration keys
             required_keys = ['audio_models', 'language_models', 'system_message']
@@ -57,7 +89,11 @@ def load_config(config_path: str = None) -> dict:
 
             return config
 
-        return safe_execute(_load_yaml, error_context="loading configuration")
+        config = safe_execute(_load_yaml, error_context="loading configuration")
+        if config_mtime is not None:
+            # Cache the pristine parse; the caller gets a private copy
+            _CONFIG_CACHE[config_path] = (config_mtime, copy.deepcopy(config))
+        return config
 
     except FileNotFoundError:
         raise ConfigurationError(
@@ -71,25 +107,226 @@ def load_config(config_path: str = None) -> dict:
         )
 
 
-def split_audio(file_path: str, chunk_minutes: int, overlap_seconds: int = 2) -> tuple[list[str], str]:
+def _probe_audio_duration(file_path: str) -> float:
+    """
+    Return the audio duration in seconds via ffprobe (no full decode).
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        Duration in seconds
+    """
+    return probe_audio_info(file_path)["duration_seconds"]
+
+
+@functools.lru_cache(maxsize=32)
+def _probe(path: str, mtime: float, size: int) -> dict:
+    """Cached ffprobe metadata; mtime/size key the cache to the file version."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "quiet", "-print_format", "json",
+            "-show_format", "-show_streams", path,
+        ],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def probe_audio_info(file_path: str) -> dict:
+    """
+    Return duration/sample-rate/channel metadata without decoding audio.
+
+    Cached per (path, mtime, size), so the validate -> stats -> split path of
+    a single job runs ffprobe once instead of fully decoding the file at
+    each step.
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        Dictionary with duration_seconds, sample_rate, channels, bit_depth
+    """
+    stat = os.stat(file_path)
+    data = _probe(file_path, stat.st_mtime, stat.st_size)
+
+    audio_stream = next(
+        (stream for stream in data.get("streams", []) if stream.get("codec_type") == "audio"),
+        {}
+    )
+    return {
+        "duration_seconds": float(data.get("format", {}).get("duration", 0.0)),
+        "sample_rate": int(audio_stream.get("sample_rate") or 0),
+        "channels": int(audio_stream.get("channels") or 0),
+        # Lossy formats report no bits_per_sample; assume 16-bit
+        "bit_depth": int(audio_stream.get("bits_per_sample") or 16),
+    }
+
+
+def _plan_chunks(
+    duration_seconds: float,
+    chunk_minutes: int,
+    overlap_seconds: int
+) -> list[tuple[float, float]]:
+    """Compute (start, end) spans in seconds for each overlapping chunk."""
+    chunk_length_seconds = chunk_minutes * 60
+
+    spans = []
+    start = 0.0
+    while start < duration_seconds:
+        end = min(start + chunk_length_seconds, duration_seconds)
+        spans.append((start, end))
+        start = end - overlap_seconds if end < duration_seconds else end
+    return spans
+
+
+# Default packing target; leaves headroom under Whisper's 25 MB upload limit
+_PACK_TARGET_MB = 20.0
+
+
+def _estimated_bytes_per_second(
+    file_path: str, duration_seconds: float, low_bandwidth: bool
+) -> float:
+    """
+    Estimate the chunk output rate, mirroring _chunk_ffmpeg_cmd: 48 kbit/s
+    in low-bandwidth mode, source bitrate for stream-copied MP3, 128 kbit/s
+    for other re-encoded formats.
+    """
+    if low_bandwidth:
+        return 48_000 / 8
+    if file_path.lower().endswith(".mp3"):
+        return os.path.getsize(file_path) / duration_seconds
+    return 128_000 / 8
+
+
+def _pack_spans(
+    spans: list[tuple[float, float]],
+    file_path: str,
+    duration_seconds: float,
+    pack_target_mb: float,
+    low_bandwidth: bool = True,
+) -> list[tuple[float, float]]:
+    """
+    Merge adjacent chunk spans while the estimated output stays under the
+    target size.
+
+    Whisper accepts one file per request, so the only way to batch many
+    short chunks is to upload fewer, longer ones. Merging at the planning
+    stage (before ffmpeg cuts anything) needs no concat pass and no extra
+    disk I/O.
+    """
+    if pack_target_mb <= 0 or len(spans) <= 1 or duration_seconds <= 0:
+        return spans
+
+    bytes_per_second = _estimated_bytes_per_second(file_path, duration_seconds, low_bandwidth)
+    target_seconds = (pack_target_mb * 1024 * 1024) / bytes_per_second
+
+    packed = []
+    start, end = spans[0]
+    for next_start, next_end in spans[1:]:
+        if next_end - start <= target_seconds:
+            end = next_end
+        else:
+            packed.append((start, end))
+            start, end = next_start, next_end
+    packed.append((start, end))
+    return packed
+
+
+def _codec_args(file_path: str, low_bandwidth: bool) -> list[str]:
+    """Encoder flags shared by the per-span and segment-muxer commands."""
+    if low_bandwidth:
+        # Whisper transcribes mono 16 kHz audio just as well as the
+        # original; 48 kbit/s shrinks uploads several-fold versus the
+        # source bitrate on slow links
+        return ["-ac", "1", "-ar", "16000", "-c:a", "libmp3lame", "-b:a", "48k"]
+    if file_path.lower().endswith(".mp3"):
+        # MP3 can be cut without re-encoding; everything else goes through
+        # libmp3lame so chunks are always MP3
+        return ["-c", "copy"]
+    return ["-c:a", "libmp3lame", "-b:a", "128k"]
+
+
+def _chunk_ffmpeg_cmd(
+    file_path: str,
+    start: float,
+    end: float,
+    chunk_path: str,
+    low_bandwidth: bool = True,
+) -> list[str]:
+    """Build the ffmpeg command that cuts one chunk out of the input."""
+    return [
+        "ffmpeg", "-y", "-v", "error",
+        "-ss", f"{start:.3f}", "-t", f"{end - start:.3f}",
+        "-i", file_path, *_codec_args(file_path, low_bandwidth), chunk_path,
+    ]
+
+
+def _segment_seconds(
+    file_path: str,
+    duration_seconds: float,
+    chunk_minutes: int,
+    pack_target_mb: float,
+    low_bandwidth: bool,
+) -> int:
+    """
+    Segment length for single-pass splitting: the largest whole multiple of
+    chunk_minutes whose estimated output stays under the packing target.
+    """
+    per_chunk = chunk_minutes * 60
+    if pack_target_mb <= 0 or duration_seconds <= 0:
+        return per_chunk
+    bytes_per_second = _estimated_bytes_per_second(file_path, duration_seconds, low_bandwidth)
+    target_seconds = (pack_target_mb * 1024 * 1024) / bytes_per_second
+    return max(per_chunk, int(target_seconds // per_chunk) * per_chunk)
+
+
+def _segment_ffmpeg_cmd(file_path: str, segment_seconds: int, low_bandwidth: bool) -> list[str]:
+    """
+    Build the single-pass ffmpeg segment-muxer command (run with the chunk
+    directory as cwd). Each completed segment's filename is written to
+    stdout via -segment_list pipe:1 as soon as it closes.
+    """
+    return [
+        "ffmpeg", "-y", "-v", "error", "-i", os.path.abspath(file_path),
+        "-f", "segment", "-segment_time", str(segment_seconds),
+        "-segment_start_number", "1",
+        "-segment_list", "pipe:1", "-segment_list_type", "flat",
+        *_codec_args(file_path, low_bandwidth), "chunk_%02d.mp3",
+    ]
+
+
+def split_audio(
+    file_path: str,
+    chunk_minutes: int,
+    overlap_seconds: int = 2,
+    pack_target_mb: float = _PACK_TARGET_MB,
+    low_bandwidth: bool = True,
+) -> tuple[list[str], str]:
     """
     Split audio file into overlapping chunks to handle API limits.
-    
-    Uses memory-efficient processing with tempfile.SpooledTemporaryFile
-    for large file handling as specified in INITIAL.md.
+
+    Cuts chunks with ffmpeg directly (-ss/-t on the input) instead of
+    decoding the whole file into an in-memory AudioSegment first, so peak
+    memory stays flat regardless of input length. MP3 inputs are cut with
+    stream copy (no re-encode); other formats are re-encoded to MP3.
     Creates a temporary directory for the chunks.
-    
+
     Args:
         file_path: Path to input audio file
         chunk_minutes: Duration of each chunk in minutes
         overlap_seconds: Overlap between chunks in seconds (default: 2)
-    
+        pack_target_mb: Merge adjacent chunks up to this estimated size to
+            reduce request count (default: 20 MB; 0 disables packing)
+        low_bandwidth: Re-encode chunks as mono 16 kHz 48 kbit/s MP3 to
+            shrink uploads (default: True; False keeps source quality)
+
     Returns:
         A tuple containing:
         - List of chunk file paths following naming convention: chunk_01.mp3, etc.
         - The path to the temporary directory created.
     """
-    from .errors import FileError, MemoryError, ValidationError, safe_execute
+    from .errors import FileError, ValidationError, safe_execute
 
     # Validate inputs
     if chunk_minutes < 1 or chunk_minutes > 10:
@@ -115,62 +352,42 @@ def split_audio(file_path: str, chunk_minutes: int, overlap_seconds: int = 2) ->
         temp_dir = tempfile.mkdtemp()
         logger.info(f"Created temporary directory for chunks: {temp_dir}")
 
-        # Use tempfile.SpooledTemporaryFile for memory efficiency (INITIAL.md requirement)
-        with tempfile.SpooledTemporaryFile():
-            try:
-                # Load audio with pydub AudioSegment for cross-format support
-                audio = AudioSegment.from_file(file_path)
-            except Exception as e:
-                raise FileError(
-                    f"Failed to load audio file: {e}",
-                    file_path=file_path,
-                    operation="loading"
-                )
+        # Probe duration once (cheap metadata read, no PCM buffer)
+        try:
+            duration_seconds = _probe_audio_duration(file_path)
+        except Exception as e:
+            raise FileError(
+                f"Failed to load audio file: {e}",
+                file_path=file_path,
+                operation="loading"
+            )
 
         # Check if audio is too short
-        if len(audio) < 1000:  # Less than 1 second
+        if duration_seconds < 1.0:
             raise ValidationError(
                 "Audio file is too short (minimum 1 second required)",
                 field="duration",
-                value=len(audio)/1000.0
+                value=duration_seconds
             )
 
-        chunk_length_ms = chunk_minutes * 60 * 1000
-        overlap_ms = overlap_seconds * 1000
+        spans = _pack_spans(
+            _plan_chunks(duration_seconds, chunk_minutes, overlap_seconds),
+            file_path, duration_seconds, pack_target_mb, low_bandwidth,
+        )
 
         chunks = []
-        start = 0
-        chunk_num = 1
 
-        # Estimate memory usage and warn if potentially problematic
-        estimated_memory_mb = (len(audio) / 1000.0) * 0.1  # Rough estimate
+        for chunk_num, (start, end) in enumerate(spans, start=1):
+            # Follow INITIAL.md naming convention: chunk_01.mp3, chunk_02.mp3, etc.
+            chunk_name = f"chunk_{chunk_num:02d}.mp3"
+            chunk_path = os.path.join(temp_dir, chunk_name)
+            logger.info(f"Creating chunk file: {chunk_path}")
 
-        if estimated_memory_mb > 1000:  # > 1GB estimated
-            raise MemoryError(
-                f"Audio file may require too much memory for processing ({estimated_memory_mb:.1f}MB estimated)",
-                file_size_mb=estimated_memory_mb,
-                memory_limit_mb=1000
-            )
-
-        while start < len(audio):
             try:
-                # Ensure overlap with previous chunk (except first)
-                end = min(start + chunk_length_ms, len(audio))
-                chunk = audio[start:end]
-
-                # Follow INITIAL.md naming convention: chunk_01.mp3, chunk_02.mp3, etc.
-                chunk_name = f"chunk_{chunk_num:02d}.mp3"
-                chunk_path = os.path.join(temp_dir, chunk_name)
-                logger.info(f"Creating chunk file: {chunk_path}")
-
-                # Export chunk to MP3 format
-                chunk.export(chunk_path, format="mp3")
-                chunks.append(chunk_path)
-
-                # Move start position with overlap consideration
-                start = end - overlap_ms if end < len(audio) else end
-                chunk_num += 1
-
+                subprocess.run(
+                    _chunk_ffmpeg_cmd(file_path, start, end, chunk_path, low_bandwidth),
+                    capture_output=True, text=True, check=True,
+                )
             except Exception as e:
                 # Cleanup any partial chunks on error
                 for partial_chunk in chunks:
@@ -180,17 +397,159 @@ def split_audio(file_path: str, chunk_minutes: int, overlap_seconds: int = 2) ->
                     except OSError:
                         pass
 
+                detail = getattr(e, 'stderr', None) or str(e)
                 raise FileError(
-                    f"Failed to export chunk {chunk_num}: {e}",
+                    f"Failed to export chunk {chunk_num}: {detail}",
                     file_path=chunk_path,
                     operation="exporting"
                 )
 
+            chunks.append(chunk_path)
+
         return chunks, temp_dir
 
     return safe_execute(_split_audio_process, error_context=f"splitting audio file {file_path}")
 
 
+async def iter_split_audio(
+    file_path: str,
+    chunk_minutes: int,
+    overlap_seconds: int = 2,
+    temp_dir: str | None = None,
+    pack_target_mb: float = _PACK_TARGET_MB,
+    low_bandwidth: bool = True,
+):
+    """
+    Async variant of split_audio that yields chunks as they are exported.
+
+    Chunks are yielded as soon as they exist on disk, so callers can start
+    uploading chunk N while chunk N+1 is still being produced instead of
+    waiting for the whole split. With overlap_seconds=0 the entire file is
+    split by one ffmpeg segment-muxer invocation (a single decode/encode
+    pass); overlapping chunks fall back to one seek-and-cut process per span.
+
+    Args:
+        file_path: Path to input audio file
+        chunk_minutes: Duration of each chunk in minutes
+        overlap_seconds: Overlap between chunks in seconds (default: 2;
+            0 selects the single-pass contiguous split)
+        temp_dir: Directory to write chunks into (default: new temp directory)
+        pack_target_mb: Merge adjacent chunks up to this estimated size to
+            reduce request count (default: 20 MB; 0 disables packing)
+        low_bandwidth: Re-encode chunks as mono 16 kHz 48 kbit/s MP3 to
+            shrink uploads (default: True; False keeps source quality)
+
+    Yields:
+        (index, total_chunks, chunk_path) tuples in chunk order
+    """
+    from .errors import FileError, ValidationError
+
+    # Validate inputs (mirrors split_audio)
+    if chunk_minutes < 1 or chunk_minutes > 10:
+        raise ValidationError(
+            "Chunk duration must be between 1-10 minutes",
+            field="chunk_minutes",
+            value=chunk_minutes
+        )
+
+    if overlap_seconds < 0 or overlap_seconds > 60:
+        raise ValidationError(
+            "Overlap seconds must be between 0-60",
+            field="overlap_seconds",
+            value=overlap_seconds
+        )
+
+    if not os.path.exists(file_path):
+        raise FileError(f"Audio file not found: {file_path}", file_path=file_path, operation="splitting")
+
+    if temp_dir is None:
+        temp_dir = tempfile.mkdtemp()
+        logger.info(f"Created temporary directory for chunks: {temp_dir}")
+
+    # Probe duration once (cheap metadata read, no PCM buffer); run in a
+    # thread so the caller's event loop stays free
+    try:
+        duration_seconds = await asyncio.to_thread(_probe_audio_duration, file_path)
+    except Exception as e:
+        raise FileError(
+            f"Failed to load audio file: {e}",
+            file_path=file_path,
+            operation="loading"
+        )
+
+    if duration_seconds < 1.0:
+        raise ValidationError(
+            "Audio file is too short (minimum 1 second required)",
+            field="duration",
+            value=duration_seconds
+        )
+
+    if overlap_seconds == 0:
+        # Contiguous chunks: ffmpeg's segment muxer splits the whole file in
+        # one invocation (one decode, one encoder instance) and reports each
+        # segment on stdout as it closes, so chunks still stream to the
+        # caller while later ones are being produced
+        segment_seconds = _segment_seconds(
+            file_path, duration_seconds, chunk_minutes, pack_target_mb, low_bandwidth
+        )
+        total_chunks = max(1, -(-int(duration_seconds) // segment_seconds))
+
+        proc = await asyncio.create_subprocess_exec(
+            *_segment_ffmpeg_cmd(file_path, segment_seconds, low_bandwidth),
+            cwd=temp_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        i = 0
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                break
+            chunk_name = line.decode().strip()
+            if not chunk_name:
+                continue
+            chunk_path = os.path.join(temp_dir, chunk_name)
+            logger.info(f"Created chunk file: {chunk_path}")
+            yield i, max(total_chunks, i + 1), chunk_path
+            i += 1
+
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0 or i == 0:
+            raise FileError(
+                f"Failed to split audio: {stderr.decode(errors='replace')}",
+                file_path=file_path,
+                operation="splitting"
+            )
+        return
+
+    spans = _pack_spans(
+        _plan_chunks(duration_seconds, chunk_minutes, overlap_seconds),
+        file_path, duration_seconds, pack_target_mb, low_bandwidth,
+    )
+    total_chunks = len(spans)
+
+    for i, (start, end) in enumerate(spans):
+        chunk_path = os.path.join(temp_dir, f"chunk_{i+1:02d}.mp3")
+        logger.info(f"Creating chunk file: {chunk_path}")
+
+        proc = await asyncio.create_subprocess_exec(
+            *_chunk_ffmpeg_cmd(file_path, start, end, chunk_path, low_bandwidth),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+        if proc.returncode != 0:
+            raise FileError(
+                f"Failed to export chunk {i+1}: {stderr.decode(errors='replace')}",
+                file_path=chunk_path,
+                operation="exporting"
+            )
+
+        yield i, total_chunks, chunk_path
+
+
 def validate_audio_file(file_path: str) -> tuple[bool, str | None, dict]:
     """
     Validate audio file format, size, and properties.
@@ -287,8 +646,9 @@ def get_audio_stats(file_path: str) -> dict:
         Dictionary with audio statistics
     """
     try:
-        audio = AudioSegment.from_file(file_path)
-        duration_seconds = len(audio) / 1000.0
+        # Metadata comes from the cached ffprobe call - no full decode
+        info = probe_audio_info(file_path)
+        duration_seconds = info['duration_seconds']
 
         # Estimate word count (rough approximation: 150 words per minute for speech)
         estimated_words = int((duration_seconds / 60) * 150)
@@ -301,32 +661,35 @@ def get_audio_stats(file_path: str) -> dict:
             'duration_formatted': format_duration(duration_seconds),
             'estimated_words': estimated_words,
             'wpm': wpm,
-            'sample_rate': audio.frame_rate,
-            'channels': audio.channels,
-            'bit_depth': audio.sample_width * 8
+            'sample_rate': info['sample_rate'],
+            'channels': info['channels'],
+            'bit_depth': info['bit_depth']
         }
     except Exception as e:
         return {'error': str(e)}
 
 
+@functools.lru_cache(maxsize=4096)
 def format_duration(seconds: float) -> str:
     """
     Format duration in seconds to HH:MM:SS format.
-    
+
+    Cached because chunk boundaries repeat (every chunk_minutes multiple)
+    across merge and stats calls.
+
     Args:
         seconds: Duration in seconds
-        
+
     Returns:
         Formatted duration string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
 
     if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     else:
-        return f"{minutes:02d}:{seconds:02d}"
+        return f"{minutes:02d}:{secs:02d}"
 
 
 def create_job_directory(job_id: str) -> str:
@@ -342,11 +705,8 @@ def create_job_directory(job_id: str) -> str:
     """
     from datetime import datetime
 
-    # Get the absolute path of the project root directory (one level up from src)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-
     date_str = datetime.now().strftime("%Y-%m-%d")
-    job_dir = os.path.join(project_root, "data", date_str, job_id)
+    job_dir = os.path.join(_PROJECT_ROOT, "data", date_str, job_id)
 
     os.makedirs(job_dir, exist_ok=True)
     logger.info(f"Created/ensured job directory: {job_dir}")
@@ -363,17 +723,18 @@ def find_job_directory(job_id: str) -> str | None:
     Returns:
         Path to job directory if found, None otherwise
     """
-    # Get the absolute path of the project root directory (one level up from src)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    data_root = os.path.join(project_root, "data")
+    data_root = os.path.join(_PROJECT_ROOT, "data")
 
-    if not os.path.exists(data_root):
+    # Search through date folders with a single scandir pass; DirEntry
+    # answers is_dir() from the cached stat instead of a fresh syscall
+    try:
+        with os.scandir(data_root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    potential_path = os.path.join(entry.path, job_id)
+                    if os.path.isdir(potential_path):
+                        return potential_path
+    except FileNotFoundError:
         return None
 
-    # Search through date folders
-    for date_folder in os.listdir(data_root):
-        potential_path = os.path.join(data_root, date_folder, job_id)
-        if os.path.exists(potential_path):
-            return potential_path
-
     return None
@@ -5,15 +5,62 @@ This file contains pytest configuration and fixtures that are shared
 across multiple test files.
 """
 
+import copy
+import json
 import os
 import sys
-import tempfile
+import types
 import pytest
 from unittest.mock import MagicMock, patch
 
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# Shared fixture data built once at import: the session-scoped fixtures below
+# hand out read-only views instead of rebuilding these literals per test
+_CONFIG = {
+    'audio_models': ['whisper-1', 'gpt-4o-mini-transcribe', 'gpt-4o-transcribe'],
+    'language_models': ['gpt-4o-mini', 'gpt-4o', 'gpt-4o-speed'],
+    'system_message': 'あなたはプロフェッショナルで親切な文字起こしアシスタントです。',
+    'default_language': 'auto',
+    'default_translation_language': 'Japanese',
+    'default_chunk_minutes': 5,
+    'max_file_size_mb': 500,
+    'supported_formats': ['.mp3', '.wav', '.m4a', '.flac', '.ogg'],
+    'translation_languages': {
+        'Japanese': 'ja',
+        'English': 'en',
+        'Spanish': 'es',
+        'French': 'fr',
+        'German': 'de',
+        'Chinese': 'zh'
+    },
+    'timestamp_format': '# HH:MM:SS --> HH:MM:SS',
+    'processing_steps': {
+        1: 'Split audio into chunks with pydub',
+        2: 'Transcribe chunks with yield-based progress',
+        3: 'Real-time markdown updates via gr.Textbox.update',
+        4: 'Full-text translation after all chunks complete'
+    }
+}
+
+_SAMPLE_TRANSCRIPT = """# 00:00:00 --> 00:01:00
+This is the first minute of the transcript.
+
+# 00:01:00 --> 00:02:00
+This is the second minute of the transcript.
+
+# 00:02:00 --> 00:03:00
+This is the third minute of the transcript."""
+
+_SAMPLE_TRANSCRIPT_JSON = tuple(
+    types.MappingProxyType(segment) for segment in [
+        {"ts": "00:00:00 --> 00:01:00", "text": "This is the first minute of the transcript."},
+        {"ts": "00:01:00 --> 00:02:00", "text": "This is the second minute of the transcript."},
+        {"ts": "00:02:00 --> 00:03:00", "text": "This is the third minute of the transcript."}
+    ]
+)
+
 
 @pytest.fixture
 def mock_api_key():
@@ -21,175 +68,157 @@ def mock_api_key():
     return "sk-1234567890abcdef1234567890abcdef1234567890abcdef"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Provide a mock configuration dictionary."""
-    return {
-        'audio_models': ['whisper-1', 'gpt-4o-mini-transcribe', 'gpt-4o-transcribe'],
-        'language_models': ['gpt-4o-mini', 'gpt-4o', 'gpt-4o-speed'],
-        'system_message': 'あなたはプロフェッショナルで親切な文字起こしアシスタントです。',
-        'default_language': 'auto',
-        'default_translation_language': 'Japanese',
-        'default_chunk_minutes': 5,
-        'max_file_size_mb': 500,
-        'supported_formats': ['.mp3', '.wav', '.m4a', '.flac', '.ogg'],
-        'translation_languages': {
-            'Japanese': 'ja',
-            'English': 'en',
-            'Spanish': 'es',
-            'French': 'fr',
-            'German': 'de',
-            'Chinese': 'zh'
-        },
-        'timestamp_format': '# HH:MM:SS --> HH:MM:SS',
-        'processing_steps': {
-            1: 'Split audio into chunks with pydub',
-            2: 'Transcribe chunks with yield-based progress',
-            3: 'Real-time markdown updates via gr.Textbox.update',
-            4: 'Full-text translation after all chunks complete'
-        }
-    }
+    """Provide a read-only mock configuration dictionary."""
+    return types.MappingProxyType(_CONFIG)
 
 
 @pytest.fixture
+def mock_config_mut():
+    """Provide a private, mutable copy of the mock configuration."""
+    return copy.deepcopy(_CONFIG)
+
+
+# Built once at import: MagicMock attribute chains allocate a child mock per
+# access, which no test needs here — a plain namespace is enough
+_OPENAI_RESPONSE = types.SimpleNamespace(
+    text="Mock transcription result",
+    choices=[types.SimpleNamespace(
+        message=types.SimpleNamespace(
+            content="Mock chat response",
+            model_dump=lambda: {"content": {"result": "success"}},
+        )
+    )],
+)
+
+
+@pytest.fixture(scope="session")
 def mock_openai_response():
     """Provide a mock OpenAI API response."""
-    response = MagicMock()
-    response.text = "Mock transcription result"
-    response.choices = [MagicMock()]
-    response.choices[0].message.content = "Mock chat response"
-    response.choices[0].message.model_dump.return_value = {"content": {"result": "success"}}
-    return response
+    return _OPENAI_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_transcript():
     """Provide a sample transcript for testing."""
-    return """# 00:00:00 --> 00:01:00
-This is the first minute of the transcript.
+    return _SAMPLE_TRANSCRIPT
 
-# 00:01:00 --> 00:02:00
-This is the second minute of the transcript.
 
-# 00:02:00 --> 00:03:00
-This is the third minute of the transcript."""
+@pytest.fixture(scope="session")
+def sample_transcript_json():
+    """Provide a read-only sample transcript in JSON format for testing."""
+    return _SAMPLE_TRANSCRIPT_JSON
 
 
-@pytest.fixture
-def sample_transcript_json():
-    """Provide a sample transcript in JSON format for testing."""
-    return [
-        {"ts": "00:00:00 --> 00:01:00", "text": "This is the first minute of the transcript."},
-        {"ts": "00:01:00 --> 00:02:00", "text": "This is the second minute of the transcript."},
-        {"ts": "00:02:00 --> 00:03:00", "text": "This is the third minute of the transcript."}
-    ]
+@pytest.fixture(scope="session")
+def _audio_blob(tmp_path_factory):
+    """Write the fake audio payload once per session."""
+    blob_path = tmp_path_factory.mktemp("audio") / "sample.mp3"
+    blob_path.write_bytes(b"fake audio data for testing")
+    return blob_path
 
 
 @pytest.fixture
-def temporary_audio_file():
-    """Create a temporary audio file for testing."""
-    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-        temp_file.write(b"fake audio data for testing")
-        temp_path = temp_file.name
-    
-    yield temp_path
-    
-    # Cleanup
+def temporary_audio_file(_audio_blob, tmp_path):
+    """Provide a per-test audio file path (hard link to the session blob)."""
+    dst = tmp_path / "sample.mp3"
     try:
-        os.unlink(temp_path)
+        os.link(_audio_blob, dst)
     except OSError:
-        pass
+        # Cross-device tmp dirs cannot hard link; fall back to a copy
+        dst.write_bytes(_audio_blob.read_bytes())
+    # pytest removes tmp_path contents itself; no manual unlink needed
+    return str(dst)
 
 
+# Default metadata served by the audio-probe patch (mirrors probe_audio_info)
+_PROBE_INFO = {
+    'duration_seconds': 60.0,
+    'sample_rate': 44100,
+    'channels': 2,
+    'bit_depth': 16,
+}
+
 @pytest.fixture
-def mock_audio_segment():
-    """Provide a mock AudioSegment for testing."""
-    with patch('src.util.AudioSegment') as mock_audio:
-        mock_instance = MagicMock()
-        mock_instance.__len__ = MagicMock(return_value=60000)  # 60 seconds
-        mock_instance.frame_rate = 44100
-        mock_instance.channels = 2
-        mock_instance.sample_width = 2
-        mock_audio.from_file.return_value = mock_instance
-        yield mock_audio
+def mock_audio_probe():
+    """Provide mocked ffprobe audio metadata, patched per test.
+
+    Scoped per function so probe_audio_info is restored the moment the
+    requesting test finishes; a session-lived patch would leak one test's
+    configured mock into every later test.
+    """
+    with patch('src.util.probe_audio_info') as mock_probe:
+        mock_probe.return_value = dict(_PROBE_INFO)
+        yield mock_probe
+
+
+# Job-directory fixture payloads, serialized once at import
+_JOB_ID = "test_job_123"
+_JOB_METADATA = {
+    "job_id": _JOB_ID,
+    "timestamp": "2024-01-15T10:30:00",
+    "original_filename": "test.mp3",
+    "file_info": {"duration_seconds": 300, "size_mb": 15.5},
+    "settings": {"default_language": "en"},
+    "translation_enabled": True
+}
+try:
+    import orjson
+    _JOB_METADATA_JSON = orjson.dumps(_JOB_METADATA)
+except ImportError:
+    _JOB_METADATA_JSON = json.dumps(
+        _JOB_METADATA, separators=(",", ":")
+    ).encode("utf-8")
+_TRANSCRIPT_BYTES = b"Sample transcript content"
+_TRANSLATION_BYTES = b"Sample translation content"
 
 
 @pytest.fixture
 def mock_job_directory(tmp_path):
     """Create a temporary job directory structure for testing."""
     # Create job directory structure
-    job_id = "test_job_123"
     date_str = "2024-01-15"
-    job_dir = tmp_path / "data" / date_str / job_id
+    job_dir = tmp_path / "data" / date_str / _JOB_ID
     job_dir.mkdir(parents=True)
-    
-    # Create sample files
-    transcript_file = job_dir / "transcript.txt"
-    transcript_file.write_text("Sample transcript content")
-    
-    translation_file = job_dir / "transcript.ja.txt"
-    translation_file.write_text("Sample translation content")
-    
-    metadata_file = job_dir / "metadata.json"
-    metadata = {
-        "job_id": job_id,
-        "timestamp": "2024-01-15T10:30:00",
-        "original_filename": "test.mp3",
-        "file_info": {"duration_seconds": 300, "size_mb": 15.5},
-        "settings": {"default_language": "en"},
-        "translation_enabled": True
-    }
-    metadata_file.write_text(str(metadata).replace("'", '"'))  # JSON format
-    
+
+    # Write the pre-serialized sample files (one write syscall each)
+    (job_dir / "transcript.txt").write_bytes(_TRANSCRIPT_BYTES)
+    (job_dir / "transcript.ja.txt").write_bytes(_TRANSLATION_BYTES)
+    (job_dir / "metadata.json").write_bytes(_JOB_METADATA_JSON)
+
     return {
-        "job_id": job_id,
+        "job_id": _JOB_ID,
         "job_dir": str(job_dir),
         "data_dir": str(tmp_path / "data"),
-        "transcript_content": "Sample transcript content",
-        "translation_content": "Sample translation content"
+        "transcript_content": _TRANSCRIPT_BYTES.decode(),
+        "translation_content": _TRANSLATION_BYTES.decode()
     }
 
 
-@pytest.fixture(autouse=True)
-def reset_imports():
-    """Reset module imports between tests to avoid state pollution."""
-    # Store original modules
-    original_modules = dict(sys.modules)
-    
-    yield
-    
-    # Remove any modules that were imported during the test
-    modules_to_remove = []
-    for module_name in sys.modules:
-        if module_name not in original_modules and (
-            module_name.startswith('src.') or 
-            module_name in ['util', 'errors', 'transcribe', 'llm', 'app']
-        ):
-            modules_to_remove.append(module_name)
-    
-    for module_name in modules_to_remove:
-        del sys.modules[module_name]
+# Module names (beyond the src. namespace) that reset_imports tracks
+_RESET_TARGETS = frozenset({'util', 'errors', 'transcribe', 'llm', 'app'})
 
 
-# Configure pytest options
-def pytest_configure(config):
-    """Configure pytest with custom options."""
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests"
-    )
-    config.addinivalue_line(
-        "markers", "unit: marks tests as unit tests"
-    )
+def _tracked_modules() -> set:
+    return {
+        name for name in sys.modules
+        if name.startswith('src.') or name in _RESET_TARGETS
+    }
 
 
-# Configure async test support
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
\ No newline at end of file
+@pytest.fixture
+def reset_imports():
+    """
+    Unload src modules imported during a test to avoid state pollution.
+
+    Opt-in (apply per module with
+    ``pytestmark = pytest.mark.usefixtures("reset_imports")``) so the many
+    tests that never re-import src.* do not pay a sys.modules scan each.
+    """
+    before = _tracked_modules()
+
+    yield
+
+    for module_name in _tracked_modules() - before:
+        del sys.modules[module_name]
@@ -0,0 +1,74 @@
+"""
+Shared Playwright fixtures.
+
+One browser context (and one APP_ENV setup) serves the whole session so the
+browser reuses its HTTP cache and parsed JS across tests; each test still
+gets a fresh page already navigated to the app.
+"""
+
+import os
+import httpx
+import pytest
+
+APP_URL = "http://localhost:7860"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_ui_env():
+    """Run the whole Playwright session against the mock-ui backend."""
+    old = os.environ.get("APP_ENV")
+    os.environ["APP_ENV"] = "mock-ui"
+    yield
+    if old is None:
+        os.environ.pop("APP_ENV", None)
+    else:
+        os.environ["APP_ENV"] = old
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _require_server():
+    """Skip the whole session fast when the app server is not running.
+
+    Without this probe every test pays the full navigation timeout before
+    failing; one half-second check short-circuits all of them.
+    """
+    try:
+        httpx.get(APP_URL, timeout=0.5)
+    except Exception as e:
+        pytest.skip(f"app server not reachable at {APP_URL}: {e}")
+
+
+@pytest.fixture(scope="session")
+def context(browser):
+    """Single browser context shared by all tests in the session."""
+    ctx = browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        ignore_https_errors=True,
+    )
+    yield ctx
+    ctx.close()
+
+
+@pytest.fixture
+def page(context):
+    """Fresh page per test, navigated to the app and ready for interaction."""
+    new_page = context.new_page()
+    # One wait budget for the whole suite; per-call timeout kwargs remain
+    # only where a test intentionally fails faster than the default
+    new_page.set_default_timeout(30_000)
+    new_page.set_default_navigation_timeout(15_000)
+    new_page.goto(APP_URL)
+    # Server reachability is verified once per session, so first paint is
+    # fast; no need for the worst-case 10 s wait here
+    new_page.wait_for_selector("text=Transcriber Web App", timeout=2000)
+    yield new_page
+    new_page.close()
+
+
+@pytest.fixture
+def translation_enabled(page):
+    """Resolve the translation checkbox once and ensure it is checked."""
+    checkbox = page.locator("input[type='checkbox']").filter(has_text="Enable Translation")
+    if not checkbox.is_checked():
+        checkbox.check()
+    return checkbox
@@ -7,112 +7,109 @@ error messaging in the UI.
 
 import pytest
 import os
+import re
 import tempfile
 import json
 from pathlib import Path
 
+# Resolved once at import: every test re-stating this path cost a stat each
+_TEST_AUDIO = Path(__file__).parent.parent / "data" / "test_audio.mp3"
+_TEST_AUDIO_EXISTS = _TEST_AUDIO.is_file()
 
+# Common error indicators, matched in one case-insensitive pass
+_ERR_RE = re.compile(r"error|failed|unavailable|timeout|invalid", re.I)
+
+
+@pytest.mark.xdist_group("app")
 class TestErrorHandling:
-    """Test error handling scenarios in the translation display system."""
-    
-    @pytest.fixture(autouse=True)
-    def setup_test_environment(self, page):
-        """Setup test environment with mock mode."""
-        # Set environment to mock-ui for testing
-        os.environ["APP_ENV"] = "mock-ui"
-        
-        # Navigate to the application
-        page.goto("http://localhost:7860")
-        
-        # Wait for the page to load
-        page.wait_for_selector("text=Transcriber Web App", timeout=10000)
-    
-    def test_translation_failure_display(self, page):
-        """Test that translation failures are handled gracefully with proper error display."""
-        # Enable translation
-        translation_checkbox = page.locator("input[type='checkbox']").filter(has_text="Enable Translation")
-        if not translation_checkbox.is_checked():
-            translation_checkbox.check()
-        
+    """Test error handling scenarios in the translation display system.
+
+    Navigation and APP_ENV setup live in the shared conftest fixtures: the
+    page fixture arrives already loaded, so tests start interacting
+    immediately.
+    """
+
+    @pytest.fixture
+    def processed_page(self, page, translation_enabled):
+        """Drive the app through the shared upload -> process -> done prelude."""
         # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
-        
-        # Mock translation failure by modifying the handler behavior
-        # This would be done through environment variables or mock configuration
-        
-        # Start processing
+        if _TEST_AUDIO_EXISTS:
+            page.locator("input[type='file']").set_input_files(str(_TEST_AUDIO))
+
+        # Start processing and wait for completion
         page.click("text=Start Processing")
-        
-        # Wait for processing to complete
-        page.wait_for_selector("text=Processing completed", timeout=30000)
-        
-        # Check that transcript is displayed even if translation fails
-        results_area = page.locator("textarea").filter(has_text="Mock transcript")
+        page.wait_for_selector("text=Processing completed")
+        return page
+
+    @pytest.mark.parametrize("scenario", [
+        "translation_failure",
+        "integrated_display_failure",
+        "network_timeout",
+        "partial_translation",
+        "download_with_errors",
+    ])
+    def test_processing_error_scenarios(self, processed_page, scenario):
+        """Processing completes and degrades gracefully across error scenarios.
+
+        The prelude (enable translation, upload, process to completion) is
+        identical for all scenarios; only the follow-up assertions differ.
+        """
+        page = processed_page
+
+        # Results should be displayed in every scenario
+        results_area = page.locator("textarea")
         assert results_area.is_visible()
-        
-        # Check for error message in translation section if translation failed
-        # The error should be shown but not prevent transcript display
-        content = results_area.input_value()
-        assert "Mock transcript" in content
-        
-        # Verify download button is still available
-        download_btn = page.locator("text=Download Results")
-        assert download_btn.is_visible()
-    
+
+        if scenario == "translation_failure":
+            # Transcript is shown even if translation fails, and download
+            # stays available
+            transcript_area = page.locator("textarea").filter(has_text="Mock transcript")
+            assert transcript_area.is_visible()
+            assert "Mock transcript" in transcript_area.input_value()
+            assert page.locator("text=Download Results").is_visible()
+        elif scenario == "integrated_display_failure":
+            # Even if integrated display generation fails, transcript shows
+            content = results_area.input_value()
+            assert len(content) > 0
+            assert "Mock transcript" in content or "transcript" in content.lower()
+        elif scenario == "partial_translation":
+            # Partial failures still surface whatever completed
+            content = results_area.input_value()
+            assert len(content) > 0
+            assert "transcript" in content.lower() or "Mock" in content
+        elif scenario == "download_with_errors":
+            # Download works even when some errors occurred along the way
+            download_btn = page.locator("text=Download Results")
+            assert download_btn.is_visible()
+            download_btn.click()
+            assert page.locator("text=Transcriber Web App").is_visible()
+        # "network_timeout": reaching completion with visible results is
+        # itself the assertion
+
     def test_file_read_failure_fallback(self, page):
         """Test fallback behavior when file reading fails."""
         # Navigate to history tab
         page.click("text=Job History")
-        
-        # Wait for history to load
-        page.wait_for_timeout(1000)
-        
+
+        # Wait for the history table to render instead of sleeping
+        page.wait_for_selector("table", timeout=5000)
+
         # Select a job (mock jobs should be available)
         job_rows = page.locator("table tbody tr")
         if job_rows.count() > 0:
             job_rows.first.click()
-            
-            # Wait for content to load
-            page.wait_for_timeout(1000)
-            
+
+            # Wait for the results area to appear with the loaded content
+            results_area = page.locator("textarea").first
+            results_area.wait_for(state="visible", timeout=5000)
+
             # Check that some content is displayed even if file reading fails
-            results_area = page.locator("textarea")
             assert results_area.is_visible()
             
             # Content should either be the actual content or an error message
             content = results_area.input_value()
             assert len(content) > 0  # Should have some content, even if it's an error message
     
-    def test_integrated_display_generation_failure(self, page):
-        """Test handling of integrated display generation failures."""
-        # Enable translation
-        translation_checkbox = page.locator("input[type='checkbox']").filter(has_text="Enable Translation")
-        if not translation_checkbox.is_checked():
-            translation_checkbox.check()
-        
-        # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
-        
-        # Start processing
-        page.click("text=Start Processing")
-        
-        # Wait for processing to complete
-        page.wait_for_selector("text=Processing completed", timeout=30000)
-        
-        # Even if integrated display generation fails, transcript should be shown
-        results_area = page.locator("textarea")
-        assert results_area.is_visible()
-        
-        content = results_area.input_value()
-        assert len(content) > 0
-        
-        # Should contain at least the transcript content
-        assert "Mock transcript" in content or "transcript" in content.lower()
-    
     def test_api_key_missing_error(self, page):
         """Test proper error display when API key is missing."""
         # Clear any existing API key
@@ -129,19 +126,19 @@ class TestErrorHandling:
                 page.click("text=Save Settings")
         
         # Try to upload and process without API key
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
+        if _TEST_AUDIO_EXISTS:
+            page.locator("input[type='file']").set_input_files(str(_TEST_AUDIO))
         
         # Start processing - should show error
         page.click("text=Start Processing")
         
         # Should show appropriate error message
-        # In mock mode, this might not trigger, but in real mode it would
-        page.wait_for_timeout(2000)
-        
-        # Check for error indication
-        error_elements = page.locator("text=error", case_sensitive=False)
+        # In mock mode, this might not trigger, but in real mode it would;
+        # wait for the network to settle instead of a fixed sleep
+        page.wait_for_load_state("networkidle")
+
+        # Check for error indication (single compiled-regex locator)
+        error_elements = page.get_by_text(_ERR_RE)
         # In mock mode, we might not see this error, so we just verify the test runs
     
     def test_unsupported_file_format_error(self, page):
@@ -158,137 +155,53 @@ class TestErrorHandling:
             # Start processing - should show error
             page.click("text=Start Processing")
             
-            # Should show appropriate error message
-            page.wait_for_timeout(2000)
-            
+            # Should show appropriate error message; wait for the network to
+            # settle instead of a fixed sleep
+            page.wait_for_load_state("networkidle")
+
             # In mock mode, validation might be bypassed, but test should run
             
         finally:
             # Clean up temporary file
             os.unlink(temp_file_path)
     
-    def test_network_timeout_error_display(self, page):
-        """Test display of network timeout errors."""
-        # This test would require mocking network conditions
-        # For now, we just verify the UI can handle such scenarios
-        
-        # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
-        
-        # Start processing
-        page.click("text=Start Processing")
-        
-        # Wait for processing to complete (should succeed in mock mode)
-        page.wait_for_selector("text=Processing completed", timeout=30000)
-        
-        # Verify results are displayed
-        results_area = page.locator("textarea")
-        assert results_area.is_visible()
-    
     def test_error_message_visibility(self, page):
         """Test that error messages are properly visible to users."""
         # This test verifies that when errors occur, they are displayed
         # in a user-friendly manner
         
         # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
+        if _TEST_AUDIO_EXISTS:
+            page.locator("input[type='file']").set_input_files(str(_TEST_AUDIO))
         
         # Start processing
         page.click("text=Start Processing")
         
-        # Wait for processing
-        page.wait_for_timeout(5000)
-        
-        # Check for any error messages in the UI
-        # Look for common error indicators
-        error_indicators = [
-            "error", "Error", "failed", "Failed", 
-            "unavailable", "timeout", "invalid"
-        ]
-        
-        page_content = page.content()
-        
+        # Wait for in-flight requests to settle rather than a worst-case sleep
+        page.wait_for_load_state("networkidle")
+
+        # Scan for error messages inside the browser: only a boolean crosses
+        # the wire instead of the whole serialized DOM from page.content()
+        errors_present = page.evaluate(
+            "() => /error|failed|unavailable|timeout|invalid/i.test(document.body.innerText)"
+        )
+
         # If any errors are present, they should be clearly visible
         # This test mainly ensures the UI doesn't crash on errors
-        
+        if errors_present:
+            assert page.get_by_text(_ERR_RE).first.is_visible()
+
         # Verify the page is still functional
-        assert "Transcriber Web App" in page_content
-    
-    def test_partial_translation_failure(self, page):
-        """Test handling of partial translation failures."""
-        # Enable translation
-        translation_checkbox = page.locator("input[type='checkbox']").filter(has_text="Enable Translation")
-        if not translation_checkbox.is_checked():
-            translation_checkbox.check()
-        
-        # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
-        
-        # Start processing
-        page.click("text=Start Processing")
-        
-        # Wait for processing to complete
-        page.wait_for_selector("text=Processing completed", timeout=30000)
-        
-        # Check that results are displayed
-        results_area = page.locator("textarea")
-        assert results_area.is_visible()
-        
-        content = results_area.input_value()
-        
-        # Should contain transcript content
-        assert len(content) > 0
-        
-        # In case of partial translation failure, should show what was completed
-        # and indicate what failed
-        assert "transcript" in content.lower() or "Mock" in content
-    
-    def test_download_functionality_with_errors(self, page):
-        """Test that download functionality works even when some errors occur."""
-        # Enable translation
-        translation_checkbox = page.locator("input[type='checkbox']").filter(has_text="Enable Translation")
-        if not translation_checkbox.is_checked():
-            translation_checkbox.check()
-        
-        # Upload a test file
-        test_audio_path = Path(__file__).parent.parent / "data" / "test_audio.mp3"
-        if test_audio_path.exists():
-            page.locator("input[type='file']").set_input_files(str(test_audio_path))
-        
-        # Start processing
-        page.click("text=Start Processing")
-        
-        # Wait for processing to complete
-        page.wait_for_selector("text=Processing completed", timeout=30000)
-        
-        # Download button should be available even if some errors occurred
-        download_btn = page.locator("text=Download Results")
-        assert download_btn.is_visible()
-        
-        # Click download (in test environment, this might not actually download)
-        # but it should not cause errors
-        download_btn.click()
-        
-        # Wait a moment to see if any errors occur
-        page.wait_for_timeout(1000)
-        
-        # Page should still be functional
-        assert page.locator("text=Transcriber Web App").is_visible()
+        assert page.get_by_text("Transcriber Web App").is_visible()
     
     def test_history_error_recovery(self, page):
         """Test error recovery in history functionality."""
         # Navigate to history tab
         page.click("text=Job History")
-        
-        # Wait for history to load
-        page.wait_for_timeout(2000)
-        
+
+        # Wait for the history table to render instead of sleeping
+        page.wait_for_selector("table", timeout=5000)
+
         # History should load even if some jobs have errors
         # Check that the history tab is functional
         history_content = page.locator("text=Job History")
@@ -302,25 +215,13 @@ class TestErrorHandling:
             if job_rows.count() > 0:
                 # Click first job
                 job_rows.first.click()
-                
+
                 # Should show some content or error message
-                page.wait_for_timeout(1000)
-                
-                # Results area should be visible
-                results_area = page.locator("textarea")
+                results_area = page.locator("textarea").first
+                results_area.wait_for(state="visible", timeout=5000)
                 assert results_area.is_visible()
 
 
-@pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
-    """Configure browser context for testing."""
-    return {
-        **browser_context_args,
-        "viewport": {"width": 1280, "height": 720},
-        "ignore_https_errors": True,
-    }
-
-
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v"])
\ No newline at end of file
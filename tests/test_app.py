@@ -40,24 +40,31 @@ class TestAppState:
         assert state.processing_message == ""
 
 
+# Static config served to load_default_settings in the success path
+_STATIC_CONFIG = {
+    'audio_models': ['whisper-1', 'gpt-4o-mini-transcribe'],
+    'language_models': ['gpt-4o-mini', 'gpt-4o'],
+    'system_message': 'Test system message',
+    'default_language': 'auto',
+    'default_translation_language': 'Japanese',
+    'default_chunk_minutes': 5
+}
+
+
+@pytest.fixture(scope="module")
+def default_settings_success():
+    """Load default settings from the static config once per module."""
+    with patch('src.app.load_config', return_value=_STATIC_CONFIG):
+        return load_default_settings()
+
+
 class TestDefaultSettings:
     """Test default settings functionality."""
-    
-    @patch('src.app.load_config')
-    def test_load_default_settings_success(self, mock_load_config):
+
+    def test_load_default_settings_success(self, default_settings_success):
         """Test successful loading of default settings."""
-        mock_config = {
-            'audio_models': ['whisper-1', 'gpt-4o-mini-transcribe'],
-            'language_models': ['gpt-4o-mini', 'gpt-4o'],
-            'system_message': 'Test system message',
-            'default_language': 'auto',
-            'default_translation_language': 'Japanese',
-            'default_chunk_minutes': 5
-        }
-        mock_load_config.return_value = mock_config
-        
-        settings = load_default_settings()
-        
+        settings = default_settings_success
+
         assert settings['audio_model'] == 'whisper-1'
         assert settings['language_model'] == 'gpt-4o-mini'
         assert settings['system_message'] == 'Test system message'
@@ -228,20 +235,18 @@ class TestJobHistory:
         
         assert jobs == []
     
-    @patch('src.app.os.path.exists')
-    @patch('src.app.os.listdir')
-    @patch('src.app.os.path.isdir')
-    @patch('builtins.open')
-    def test_get_job_history_with_jobs(self, mock_open, mock_isdir, mock_listdir, mock_exists):
+    def test_get_job_history_with_jobs(self, monkeypatch):
         """Test getting job history with existing jobs."""
-        # Mock directory structure
-        mock_exists.return_value = True
-        mock_listdir.side_effect = [
+        # Stub the filesystem with plain callables instead of a stack of
+        # patch decorators (no per-test MagicMock tree to build)
+        monkeypatch.setattr('src.app.os.path.exists', lambda path: True)
+        listings = iter([
             ["2024-01-15"],  # Date folders
             ["job_123"]      # Job folders
-        ]
-        mock_isdir.return_value = True
-        
+        ])
+        monkeypatch.setattr('src.app.os.listdir', lambda path: next(listings))
+        monkeypatch.setattr('src.app.os.path.isdir', lambda path: True)
+
         # Mock metadata file
         mock_metadata = {
             "job_id": "job_123",
@@ -250,13 +255,12 @@ class TestJobHistory:
             "file_info": {"duration_seconds": 300},
             "settings": {"default_language": "en"}
         }
-        
-        mock_open.return_value.__enter__ = MagicMock()
-        mock_open.return_value.__exit__ = MagicMock()
-        
-        with patch('json.load', return_value=mock_metadata):
-            jobs = get_job_history()
-        
+
+        monkeypatch.setattr('builtins.open', MagicMock())
+        monkeypatch.setattr('json.load', lambda f: mock_metadata)
+
+        jobs = get_job_history()
+
         assert len(jobs) == 1
         assert jobs[0][0] == "job_123"  # job_id
         assert jobs[0][2] == "test.mp3"  # filename
@@ -266,37 +270,30 @@ class TestJobHistory:
 class TestLoadJobTranscript:
     """Test job transcript loading functionality."""
     
-    @patch('src.app.os.path.exists')
-    @patch('src.app.os.listdir')
-    @patch('src.app.os.path.isdir')
-    @patch('builtins.open')
-    def test_load_job_transcript_success(self, mock_open, mock_isdir, mock_listdir, mock_exists):
+    def test_load_job_transcript_success(self, monkeypatch):
         """Test successful job transcript loading."""
-        # Mock directory structure
-        def side_effect_exists(path):
-            return "job_123" in path
-        
-        mock_exists.side_effect = side_effect_exists
-        mock_listdir.return_value = ["2024-01-15"]
-        mock_isdir.return_value = True
-        
+        # Stub the filesystem with plain callables instead of a stack of
+        # patch decorators
+        monkeypatch.setattr('src.app.os.path.exists', lambda path: "job_123" in path)
+        monkeypatch.setattr('src.app.os.path.isdir', lambda path: True)
+        monkeypatch.setattr(
+            'src.app.os.listdir',
+            lambda path: ["transcript.txt", "transcript.ja.txt", "metadata.json"]
+        )
+
         # Mock file reading
-        def side_effect_open(path, mode='r', encoding=None):
+        def fake_open(path, mode='r', encoding=None):
             mock_file = MagicMock()
             if "transcript.txt" in path:
                 mock_file.read.return_value = "Original transcript text"
             elif "transcript.ja.txt" in path:
                 mock_file.read.return_value = "Translated transcript text"
             return mock_file.__enter__.return_value
-        
-        mock_open.side_effect = side_effect_open
-        
-        # Mock listdir for job directory
-        with patch('src.app.os.listdir') as mock_job_listdir:
-            mock_job_listdir.return_value = ["transcript.txt", "transcript.ja.txt", "metadata.json"]
-            
-            transcript, translation = load_job_transcript("job_123")
-        
+
+        monkeypatch.setattr('builtins.open', fake_open)
+
+        transcript, translation = load_job_transcript("job_123")
+
         assert transcript == "Original transcript text"
         assert translation == "Translated transcript text"
     
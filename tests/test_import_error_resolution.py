@@ -11,6 +11,9 @@ import subprocess
 import pytest
 from unittest.mock import patch, MagicMock
 
+# These tests exercise import behavior itself, so unload src modules between tests
+pytestmark = pytest.mark.usefixtures("reset_imports")
+
 
 class TestImportErrorResolution:
     """Test that import errors have been resolved."""
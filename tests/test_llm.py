@@ -7,7 +7,7 @@ Tests LLM functionality, translation, chat context injection, and CLI interface.
 import os
 import json
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import pytest
 
 # Import the modules to test
@@ -75,12 +75,12 @@ class TestDataModels:
 class TestBasicChatFunctionality:
     """Test basic chat completion functionality."""
     
-    @patch('src.llm.openai')
-    def test_chat_completion_first_call(self, mock_openai):
+    @patch('src.llm._get_sync_client')
+    def test_chat_completion_first_call(self, mock_get_client):
         """Test chat completion on first call."""
         mock_response = MagicMock()
         mock_response.choices[0].message.content = "Assistant response"
-        mock_openai.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value.chat.completions.create.return_value = mock_response
         
         response, history = chat_completion(
             api_key="test-key",
@@ -96,12 +96,12 @@ class TestBasicChatFunctionality:
         assert history[1]["role"] == "assistant"
         assert history[1]["content"] == "Assistant response"
     
-    @patch('src.llm.openai')
-    def test_chat_completion_with_history(self, mock_openai):
+    @patch('src.llm._get_sync_client')
+    def test_chat_completion_with_history(self, mock_get_client):
         """Test chat completion with existing history."""
         mock_response = MagicMock()
         mock_response.choices[0].message.content = "Follow-up response"
-        mock_openai.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value.chat.completions.create.return_value = mock_response
         
         existing_history = [
             {"role": "user", "content": "Previous question"},
@@ -118,53 +118,64 @@ class TestBasicChatFunctionality:
         assert response == "Follow-up response"
         assert len(history) == 4  # previous 2 + new 2
     
-    @patch('src.llm.chat_completion')
-    async def test_chat_completion_async_success(self, mock_chat_completion):
+    @patch('src.llm._get_async_client')
+    async def test_chat_completion_async_success(self, mock_get_client):
         """Test async chat completion success."""
-        mock_chat_completion.return_value = ("Response", [])
-        
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Response"
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_get_client.return_value = mock_client
+
         response, history = await chat_completion_async(
             api_key="test-key",
             model="gpt-4o-mini",
             message="Test message"
         )
-        
+
         assert response == "Response"
-        assert history == []
-    
-    @patch('src.llm.chat_completion')
-    async def test_chat_completion_async_with_retries(self, mock_chat_completion):
+        assert len(history) == 2  # user + assistant
+        assert history[0]["content"] == "Test message"
+        assert history[1]["content"] == "Response"
+
+    @patch('src.llm.asyncio.sleep', new_callable=AsyncMock)
+    @patch('src.llm._get_async_client')
+    async def test_chat_completion_async_with_retries(self, mock_get_client, mock_sleep):
         """Test async chat completion with retries."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Success"
+        mock_client = MagicMock()
         # First two calls fail, third succeeds
-        mock_chat_completion.side_effect = [
+        mock_client.chat.completions.create = AsyncMock(side_effect=[
             Exception("Temporary error"),
             Exception("Another error"),
-            ("Success", [])
-        ]
-        
+            mock_response
+        ])
+        mock_get_client.return_value = mock_client
+
         response, history = await chat_completion_async(
             api_key="test-key",
             model="gpt-4o-mini",
             message="Test message",
             max_retries=3
         )
-        
+
         assert response == "Success"
-        assert mock_chat_completion.call_count == 3
+        assert mock_client.chat.completions.create.call_count == 3
 
 
 class TestChatWithContext:
     """Test chat with context injection functionality."""
     
-    @patch('src.llm.openai')
+    @patch('src.llm._get_sync_client')
     @patch('src.llm.validate_api_key')
-    def test_chat_with_context_success(self, mock_validate, mock_openai):
+    def test_chat_with_context_success(self, mock_validate, mock_get_client):
         """Test successful chat with context injection."""
         mock_validate.return_value = None
-        
+
         mock_response = MagicMock()
         mock_response.choices[0].message.content = "Context-aware response"
-        mock_openai.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value.chat.completions.create.return_value = mock_response
         
         response = chat_with_context(
             api_key="test-key",
@@ -177,7 +188,7 @@ class TestChatWithContext:
         assert response == "Context-aware response"
         
         # Verify that openai was called with proper message structure
-        call_args = mock_openai.chat.completions.create.call_args
+        call_args = mock_get_client.return_value.chat.completions.create.call_args
         messages = call_args[1]['messages']
         
         # Should have 3 messages: system, context, question
@@ -283,7 +294,7 @@ Single line"""
 class TestTranslationFunctionality:
     """Test translation functionality."""
     
-    @patch('src.llm.structured_completion')
+    @patch('src.llm.structured_completion_async')
     @patch('src.llm.validate_api_key')
     async def test_translate_transcript_json_success(self, mock_validate, mock_structured):
         """Test successful JSON transcript translation."""
@@ -405,14 +416,14 @@ class TestLanguageCodeUtility:
 class TestStructuredCompletion:
     """Test structured completion functionality."""
     
-    @patch('src.llm.openai')
-    def test_structured_completion_success(self, mock_openai):
+    @patch('src.llm._get_sync_client')
+    def test_structured_completion_success(self, mock_get_client):
         """Test successful structured completion."""
         mock_response = MagicMock()
         mock_response.choices[0].message.model_dump.return_value = {
             "content": {"key": "value"}
         }
-        mock_openai.chat.completions.create.return_value = mock_response
+        mock_get_client.return_value.chat.completions.create.return_value = mock_response
         
         schema = {
             "type": "object",
@@ -431,7 +442,7 @@ class TestStructuredCompletion:
         assert result == {"key": "value"}
         
         # Verify structured output was requested
-        call_args = mock_openai.chat.completions.create.call_args
+        call_args = mock_get_client.return_value.chat.completions.create.call_args
         assert call_args[1]['response_format']['type'] == 'json_object'
         assert call_args[1]['response_format']['schema'] == schema
 
@@ -16,6 +16,9 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 import run
 
+# Entry-point tests import src modules as a side effect; unload them between tests
+pytestmark = pytest.mark.usefixtures("reset_imports")
+
 
 class TestRunEntryPoint:
     """Test the run.py entry point functionality."""
@@ -106,15 +106,20 @@ class TestBasicTranscription:
 class TestChunkedTranscription:
     """Test chunked transcription functionality."""
     
-    @patch('src.transcribe.split_audio')
+    @patch('src.transcribe.iter_split_audio')
     @patch('src.transcribe.transcribe_single_chunk')
     @patch('src.transcribe.merge_transcription_results')
     @patch('src.transcribe.cleanup_chunks')
-    async def test_transcribe_chunked_success(self, mock_cleanup, mock_merge, mock_single_chunk, mock_split):
+    async def test_transcribe_chunked_success(self, mock_cleanup, mock_merge, mock_single_chunk, mock_iter_split):
         """Test successful chunked transcription."""
-        # Mock split_audio
-        mock_split.return_value = ["chunk_01.mp3", "chunk_02.mp3"]
-        
+        # Stub the streaming splitter: an async generator yielding
+        # (index, total_chunks, chunk_path) as ffmpeg would produce them
+        async def fake_iter_split(*args, **kwargs):
+            for i, path in enumerate(["chunk_01.mp3", "chunk_02.mp3"]):
+                yield i, 2, path
+
+        mock_iter_split.side_effect = fake_iter_split
+
         # Mock transcribe_single_chunk
         mock_result_1 = {
             'text': 'First chunk text',
@@ -270,14 +275,17 @@ class TestFormatTranscriptForDisplay:
 class TestProgressCallback:
     """Test progress callback functionality."""
     
-    @patch('src.transcribe.split_audio')
+    @patch('src.transcribe.iter_split_audio')
     @patch('src.transcribe.transcribe_single_chunk')
     @patch('src.transcribe.merge_transcription_results')
     @patch('src.transcribe.cleanup_chunks')
-    async def test_transcribe_chunked_with_progress_callback(self, mock_cleanup, mock_merge, mock_single_chunk, mock_split):
+    async def test_transcribe_chunked_with_progress_callback(self, mock_cleanup, mock_merge, mock_single_chunk, mock_iter_split):
         """Test chunked transcription with progress callback."""
-        # Mock dependencies
-        mock_split.return_value = ["chunk_01.mp3"]
+        # Stub the streaming splitter with a single produced chunk
+        async def fake_iter_split(*args, **kwargs):
+            yield 0, 1, "chunk_01.mp3"
+
+        mock_iter_split.side_effect = fake_iter_split
         mock_single_chunk.return_value = {
             'text': 'Test text',
             'segments': [],
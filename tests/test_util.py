@@ -152,17 +152,16 @@ class TestEstimateProcessingTime:
 class TestGetAudioStats:
     """Test audio statistics functionality."""
     
-    @patch('src.util.AudioSegment')
-    def test_get_audio_stats_success(self, mock_audio_segment):
+    @patch('util.probe_audio_info')
+    def test_get_audio_stats_success(self, mock_probe):
         """Test successful audio stats extraction."""
-        mock_audio = MagicMock()
-        mock_audio.__len__ = MagicMock(return_value=60000)  # 60 seconds
-        mock_audio.frame_rate = 44100
-        mock_audio.channels = 2
-        mock_audio.sample_width = 2
-        
-        mock_audio_segment.from_file.return_value = mock_audio
-        
+        mock_probe.return_value = {
+            'duration_seconds': 60.0,
+            'sample_rate': 44100,
+            'channels': 2,
+            'bit_depth': 16,
+        }
+
         stats = get_audio_stats("test.mp3")
         
         assert 'duration_seconds' in stats
@@ -177,11 +176,11 @@ class TestGetAudioStats:
         assert stats['channels'] == 2
         assert stats['bit_depth'] == 16
     
-    @patch('src.util.AudioSegment')
-    def test_get_audio_stats_error(self, mock_audio_segment):
+    @patch('util.probe_audio_info')
+    def test_get_audio_stats_error(self, mock_probe):
         """Test audio stats extraction with error."""
-        mock_audio_segment.from_file.side_effect = Exception("Failed to load audio")
-        
+        mock_probe.side_effect = Exception("Failed to load audio")
+
         stats = get_audio_stats("invalid.mp3")
         
         assert 'error' in stats